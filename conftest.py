@@ -0,0 +1,35 @@
+"""pytest hooks for the Smart Hub test suite.
+
+The suite is plain unittest and runs fine without pytest, but when it is
+collected by pytest (optionally parallelised with pytest-xdist's
+``-n auto``) most of the wall time goes into building fixture trees.
+Pointing tempfile at a tmpfs mount makes that work DRAM-bound instead of
+SSD-bound. Each process gets its own pid-scoped root, so xdist workers
+never contend on the same directory.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+_scratch_root = None
+
+
+def pytest_configure(config):
+    global _scratch_root
+    if os.environ.get('TMPDIR'):
+        return  # caller already chose scratch space
+    shm = Path('/dev/shm')
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        _scratch_root = shm / f"hc-{os.getpid()}"
+        _scratch_root.mkdir(exist_ok=True)
+        tempfile.tempdir = str(_scratch_root)
+
+
+def pytest_unconfigure(config):
+    global _scratch_root
+    if _scratch_root is not None:
+        tempfile.tempdir = None
+        shutil.rmtree(_scratch_root, ignore_errors=True)
+        _scratch_root = None
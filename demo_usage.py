@@ -7,12 +7,18 @@ Demonstrates real-world usage scenarios
 import os
 import sys
 import time
-import json
-import tempfile
 import subprocess
 from pathlib import Path
 from datetime import datetime
-import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+# Skip demo pacing sleeps when output is piped (CI, logs) or explicitly requested
+DEMO_FAST = not sys.stdout.isatty() or bool(os.environ.get('HARDCARD_DEMO_FAST'))
+
+def demo_sleep(seconds):
+    """Pause for demo pacing, unless running in fast mode"""
+    if not DEMO_FAST:
+        time.sleep(seconds)
 
 # Add colors for demo output
 class Colors:
@@ -42,42 +48,29 @@ def print_info(text):
 def print_warning(text):
     print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
 
-def run_command(cmd, description=None):
+def run_command(argv, cwd=None, description=None, capture=False):
     """Run a command and display output"""
     if description:
         print_info(description)
-    
-    print(f"{Colors.BLUE}$ {cmd}{Colors.ENDC}")
-    
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+
+    print(f"{Colors.BLUE}$ {' '.join(argv)}{Colors.ENDC}")
+
+    if not capture:
+        # Let output stream straight to the terminal instead of buffering it
+        result = subprocess.run(argv, cwd=cwd)
+        return result.returncode == 0
+
+    # Capture bytes and decode only what actually gets printed
+    result = subprocess.run(argv, cwd=cwd, capture_output=True)
     if result.stdout:
-        print(result.stdout)
+        print(result.stdout.decode(errors='replace'))
     if result.stderr and result.returncode != 0:
-        print(f"{Colors.RED}{result.stderr}{Colors.ENDC}")
-    
+        print(f"{Colors.RED}{result.stderr.decode(errors='replace')}{Colors.ENDC}")
+
     return result.returncode == 0
 
-def create_demo_repository(size_mb=75):
-    """Create a demo repository with various file types"""
-    print_step("Creating demo repository...")
-    
-    temp_dir = tempfile.mkdtemp(prefix="hardcard_demo_")
-    repo_path = Path(temp_dir) / "demo-large-project"
-    repo_path.mkdir()
-    
-    # Initialize git repository
-    os.chdir(repo_path)
-    run_command("git init", "Initializing Git repository")
-    
-    # Create project structure
-    print_info("Creating project structure...")
-    
-    # Source code
-    src_dir = repo_path / "src"
-    src_dir.mkdir()
-    
-    for i in range(20):
-        code = f"""
+# Shared source-module template, formatted once per module then repeated
+MODULE_TEMPLATE = """
 # Module {i}
 import os
 import sys
@@ -86,7 +79,7 @@ class Module{i}:
     def __init__(self):
         self.name = "Module {i}"
         self.data = [x for x in range(1000)]
-    
+
     def process(self):
         return sum(self.data)
 
@@ -96,8 +89,80 @@ def main():
 
 if __name__ == "__main__":
     main()
-""" * 50  # Make files larger
-        (src_dir / f"module_{i}.py").write_text(code)
+"""
+
+def write_file(path, data):
+    """Write bytes with raw os calls - no per-file flush/fsync roundtrips"""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+def tree_stats(path):
+    """Count files and sum their sizes in a single traversal"""
+    file_count = 0
+    total_bytes = 0
+    stack = [path]
+    while stack:
+        for entry in os.scandir(stack.pop()):
+            if entry.is_file(follow_symlinks=False):
+                file_count += 1
+                total_bytes += entry.stat(follow_symlinks=False).st_size
+            elif entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+    return file_count, total_bytes
+
+def fill_with_random(path, size_bytes, buf=None):
+    """Fill a file with pseudo-random bytes through an mmap view
+
+    Generates a single 1MB pseudo-random buffer and tiles it across the file,
+    so the RNG runs once instead of once per megabyte. Returns the buffer so
+    callers can reuse it for other fixtures.
+    """
+    import mmap
+    import random
+
+    if buf is None:
+        buf = random.randbytes(1024 * 1024)
+
+    with open(path, "w+b") as f:
+        f.truncate(size_bytes)
+        with mmap.mmap(f.fileno(), size_bytes) as mm:
+            step = len(buf)
+            for offset in range(0, size_bytes, step):
+                n = min(step, size_bytes - offset)
+                mm[offset:offset + n] = buf[:n]
+
+    return buf
+
+def create_demo_repository(size_mb=75, random_content=False):
+    """Create a demo repository with various file types"""
+    import tempfile
+
+    print_step("Creating demo repository...")
+
+    temp_dir = tempfile.mkdtemp(prefix="hardcard_demo_")
+    repo_path = Path(temp_dir) / "demo-large-project"
+    repo_path.mkdir()
+    
+    # Initialize git repository
+    run_command(["git", "init"], cwd=repo_path, description="Initializing Git repository")
+    
+    # Create project structure
+    print_info("Creating project structure...")
+
+    # Queue up (path, bytes) pairs and write them in one parallel pass below
+    write_jobs = []
+
+    # Source code
+    src_dir = repo_path / "src"
+    src_dir.mkdir()
+    
+    for i in range(20):
+        # Format and encode the small template once, then repeat the bytes
+        code = MODULE_TEMPLATE.format(i=i).encode() * 50  # Make files larger
+        write_jobs.append((src_dir / f"module_{i}.py", code))
     
     # Documentation
     docs_dir = repo_path / "docs"
@@ -117,18 +182,18 @@ This is a demonstration of the HardCard Smart GitHub Hub.
 ## Project Structure
 """ * 100  # Make it larger
     
-    (docs_dir / "README.md").write_text(readme_content)
+    write_jobs.append((docs_dir / "README.md", readme_content.encode()))
     
     # Data files
     data_dir = repo_path / "data"
     data_dir.mkdir()
     
-    # Create CSV with lots of data
-    csv_content = "id,name,value,timestamp,description\n"
-    for i in range(50000):
-        csv_content += f"{i},item_{i},{i*100},{datetime.now()},Description for item {i}\n"
-    
-    (data_dir / "large_dataset.csv").write_text(csv_content)
+    # Create CSV with lots of data (built as a list to avoid quadratic string concat)
+    timestamp = datetime.now().isoformat()
+    rows = ["id,name,value,timestamp,description"]
+    rows.extend(f"{i},item_{i},{i*100},{timestamp},Description for item {i}"
+                for i in range(50000))
+    write_jobs.append((data_dir / "large_dataset.csv", "\n".join(rows).encode()))
     
     # Binary files (models, images, etc.)
     print_info(f"Creating {size_mb}MB of binary data...")
@@ -136,19 +201,31 @@ This is a demonstration of the HardCard Smart GitHub Hub.
     models_dir = repo_path / "models"
     models_dir.mkdir()
     
-    # Create large binary file
-    chunk_size = 1024 * 1024  # 1MB
-    with open(models_dir / "trained_model.bin", "wb") as f:
-        for _ in range(size_mb):
-            f.write(os.urandom(chunk_size))
-    
+    # Create large binary file - allocate blocks without generating random bytes,
+    # nothing downstream ever inspects the content. Callers that need non-zero
+    # data (e.g. to defeat deduplication) can pass random_content=True, which
+    # populates the file via mmap with a fast non-crypto RNG.
+    rand_buf = None
+    if random_content:
+        rand_buf = fill_with_random(models_dir / "trained_model.bin", size_mb * 1024 * 1024)
+    else:
+        with open(models_dir / "trained_model.bin", "wb") as f:
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(f.fileno(), 0, size_mb * 1024 * 1024)
+            else:
+                f.truncate(size_mb * 1024 * 1024)
+
     # Add some images
     assets_dir = repo_path / "assets"
     assets_dir.mkdir()
-    
+
     for i in range(5):
-        with open(assets_dir / f"image_{i}.jpg", "wb") as f:
-            f.write(os.urandom(500 * 1024))  # 500KB each
+        if rand_buf is not None:
+            # Reuse the already-generated random buffer for image content
+            (assets_dir / f"image_{i}.jpg").write_bytes(rand_buf[:500 * 1024])
+        else:
+            with open(assets_dir / f"image_{i}.jpg", "wb") as f:
+                f.truncate(500 * 1024)  # 500KB each
     
     # Create .gitignore
     gitignore = """
@@ -161,15 +238,26 @@ __pycache__/
 node_modules/
 *.log
 """
-    (repo_path / ".gitignore").write_text(gitignore)
-    
-    # Get repository size
-    total_size = sum(f.stat().st_size for f in repo_path.rglob("*") if f.is_file())
+    write_jobs.append((repo_path / ".gitignore", gitignore.encode()))
+
+    # Flush the queued files in parallel - each write releases the GIL during
+    # the syscall, so threads overlap filesystem work (capped at 8 workers).
+    # Durability is deferred to a single sync below instead of per-file flushes;
+    # the subsequent git add reads through the page cache, so nothing needs to
+    # reach disk first.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda job: write_file(job[0], job[1]), write_jobs))
+
+    if hasattr(os, 'sync'):
+        os.sync()
+
+    # Get repository size and file count in one walk
+    file_count, total_size = tree_stats(repo_path)
     size_mb = total_size / (1024 * 1024)
-    
+
     print_success(f"Demo repository created: {repo_path}")
     print_success(f"Total size: {size_mb:.1f}MB")
-    print_success(f"Total files: {len(list(repo_path.rglob('*')))}")
+    print_success(f"Total files: {file_count}")
     
     return repo_path
 
@@ -179,11 +267,11 @@ def demo_scenario_1_basic_upload():
     
     # Create demo repo
     repo_path = create_demo_repository(size_mb=25)
-    os.chdir(repo_path)
-    
+
     print_step("Adding files to Git...")
-    run_command("git add .", "Staging all files")
-    run_command('git commit -m "Initial commit with large files"', "Creating commit")
+    run_command(["git", "add", "."], cwd=repo_path, description="Staging all files")
+    run_command(["git", "commit", "-m", "Initial commit with large files"],
+                cwd=repo_path, description="Creating commit")
     
     print_step("Simulating traditional git push (would timeout)...")
     print_warning("Traditional push would fail with files >100MB")
@@ -193,17 +281,17 @@ def demo_scenario_1_basic_upload():
     
     # Simulate smart upload
     print_info("🚀 Initiating Smart Upload Manager")
-    time.sleep(1)
+    demo_sleep(1)
     
     print_info("📊 Analyzing repository...")
     print(f"  • Total files: 30+")
     print(f"  • Large files detected: 1 (trained_model.bin)")
     print(f"  • Compressible content: 5MB")
-    time.sleep(1)
+    demo_sleep(1)
     
     print_info("🌐 Detecting network speed...")
     print(f"  • Network speed: MEDIUM (5MB chunks)")
-    time.sleep(1)
+    demo_sleep(1)
     
     print_info("📦 Creating intelligent chunks...")
     print(f"  • Chunk 1: 5MB (models/trained_model.bin part 1/5)")
@@ -212,20 +300,21 @@ def demo_scenario_1_basic_upload():
     print(f"  • Chunk 4: 5MB (models/trained_model.bin part 4/5)")
     print(f"  • Chunk 5: 5MB (models/trained_model.bin part 5/5)")
     print(f"  • Chunk 6: 2MB (compressed source code)")
-    time.sleep(1)
+    demo_sleep(1)
     
     print_info("📤 Starting parallel upload (3 concurrent)...")
     
     # Simulate upload progress
     for i in range(0, 101, 10):
         print(f"  Progress: [{'█' * (i//5)}{'░' * (20-i//5)}] {i}%", end='\r')
-        time.sleep(0.3)
+        demo_sleep(0.3)
     
     print()
     print_success("Upload completed successfully!")
     print_success("All chunks verified with checksums")
     
     # Cleanup
+    import shutil
     shutil.rmtree(repo_path.parent, ignore_errors=True)
 
 def demo_scenario_2_interrupted_upload():
@@ -234,21 +323,20 @@ def demo_scenario_2_interrupted_upload():
     
     print_step("Creating large repository (50MB)...")
     repo_path = create_demo_repository(size_mb=50)
-    os.chdir(repo_path)
-    
+
     print_step("Starting upload...")
     print_info("📤 Uploading chunks...")
     
     # Simulate interruption
     for i in range(0, 61, 10):
         print(f"  Progress: [{'█' * (i//5)}{'░' * (20-i//5)}] {i}%", end='\r')
-        time.sleep(0.2)
+        demo_sleep(0.2)
     
     print()
     print_warning("⚠️ Connection lost at 60%!")
     print_warning("Traditional git push would restart from 0%")
     
-    time.sleep(2)
+    demo_sleep(2)
     
     print_step("HardCard Smart Hub recovering...")
     print_info("🔄 Loading saved session: abc123def456")
@@ -258,13 +346,14 @@ def demo_scenario_2_interrupted_upload():
     # Resume upload
     for i in range(60, 101, 10):
         print(f"  Progress: [{'█' * (i//5)}{'░' * (20-i//5)}] {i}%", end='\r')
-        time.sleep(0.2)
+        demo_sleep(0.2)
     
     print()
     print_success("Upload resumed and completed!")
     print_success("Time saved: ~3 minutes (no re-upload needed)")
     
     # Cleanup
+    import shutil
     shutil.rmtree(repo_path.parent, ignore_errors=True)
 
 def demo_scenario_3_network_adaptation():
@@ -289,7 +378,7 @@ def demo_scenario_3_network_adaptation():
         print(f"  • Upload speed: ", end="")
         for _ in range(20):
             print("▓", end="", flush=True)
-            time.sleep(0.05)
+            demo_sleep(0.05)
         print(f" {chunk_mb * 2}MB/s")
     
     print_success("\nSmart Hub automatically optimizes for any network!")
@@ -302,7 +391,7 @@ def demo_scenario_4_git_hook_integration():
     
     # Simulate git push with large files
     print_info("$ git push origin main")
-    time.sleep(1)
+    demo_sleep(1)
     
     print_warning("🔍 Pre-push hook activated!")
     print_info("Analyzing push content...")
@@ -321,7 +410,7 @@ def demo_scenario_4_git_hook_integration():
     print("  2. Abort and use git-smart push")
     print("  3. Install HardCard Smart Hub")
     
-    time.sleep(2)
+    demo_sleep(2)
     print_info("\nUser selected: Use git-smart push")
     
     print_step("Switching to Smart Upload...")
@@ -345,7 +434,7 @@ def demo_scenario_5_claude_flow():
     for agent_name, icon, description in agents:
         print_info(f"{icon} Agent '{agent_name}' ready")
         print(f"    {description}")
-        time.sleep(0.3)
+        demo_sleep(0.3)
     
     print_step("\nExecuting coordinated workflow...")
     
@@ -361,7 +450,7 @@ def demo_scenario_5_claude_flow():
     for agent, action, result in workflow_steps:
         print(f"\n  🤖 {agent}")
         print(f"     Action: {action}")
-        time.sleep(0.5)
+        demo_sleep(0.5)
         print(f"     Result: {Colors.GREEN}{result}{Colors.ENDC}")
     
     print_success("\n✅ Claude Flow coordination complete!")
@@ -397,7 +486,7 @@ def main():
         if i < len(scenarios):
             print(f"\n{Colors.CYAN}Press Enter to continue to next scenario...{Colors.ENDC}")
             # In automated mode, just continue
-            time.sleep(2)
+            demo_sleep(2)
     
     # Final summary
     print_header("DEMO COMPLETE")
@@ -8,33 +8,56 @@ import os
 import sys
 import subprocess
 import json
-import shutil
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
-import argparse
 import re
+import functools
+
+# Shared defaults and config location, resolved once per process
+DEFAULT_CONFIG = {
+    'auto_detect_threshold_mb': 10,
+    'auto_chunk_enabled': True
+}
+CONFIG_DIR = Path.home() / '.hardcard-hub'
+
+# Compiled once at import; also strips a trailing .git suffix. The repo
+# segment allows dots (my.repo is a valid name); the lazy match plus the
+# anchored suffix still peels off exactly one trailing .git
+GH_URL_RE = re.compile(r'github\.com[:/]([^/]+/[^/]+?)(?:\.git)?$')
+
+@functools.lru_cache(maxsize=1)
+def _parse_config(path_str: str, mtime_ns: int) -> Dict:
+    """Parse the config file, cached on (path, mtime)"""
+    with open(path_str) as f:
+        return json.load(f)
 
 class GitHubCLIInterceptor:
     """Intercepts GitHub CLI commands and applies smart chunking when needed"""
-    
+
     def __init__(self):
-        self.config_path = Path.home() / '.hardcard-hub' / 'config.json'
-        self.smart_hub_path = Path.home() / '.hardcard-hub' / 'smart-upload-manager.py'
+        self.config_path = CONFIG_DIR / 'config.json'
+        self.smart_hub_path = CONFIG_DIR / 'smart-upload-manager.py'
         self.config = self.load_config()
         self.original_gh = self.find_original_gh()
-        
+
     def load_config(self) -> Dict:
         """Load configuration"""
-        if self.config_path.exists():
-            with open(self.config_path) as f:
-                return json.load(f)
-        return {
-            'auto_detect_threshold_mb': 10,
-            'auto_chunk_enabled': True
-        }
-    
+        try:
+            st = os.stat(self.config_path)
+            return dict(_parse_config(str(self.config_path), st.st_mtime_ns))
+        except (OSError, ValueError):
+            return dict(DEFAULT_CONFIG)
+
     def find_original_gh(self) -> Optional[str]:
         """Find the original gh CLI binary"""
+        # Reuse the path cached in config - gh is installed once per machine,
+        # so skip the PATH walk and stat probes on every invocation
+        cached = self.config.get('original_gh')
+        if cached and Path(cached).exists() and cached != sys.argv[0]:
+            return cached
+
+        import shutil
+
         # Look for gh in standard locations
         paths = [
             '/usr/local/bin/gh',
@@ -42,63 +65,109 @@ class GitHubCLIInterceptor:
             '/usr/bin/gh',
             shutil.which('gh.original'),  # If we renamed it
         ]
-        
+
         for path in paths:
             if path and Path(path).exists() and path != sys.argv[0]:
+                self.save_original_gh(path)
                 return path
-        
+
         return None
+
+    def save_original_gh(self, path: str):
+        """Cache the resolved gh path in config for future invocations"""
+        self.config['original_gh'] = path
+        try:
+            self.config_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.config_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(self.config, f, indent=2)
+            os.replace(tmp_path, self.config_path)
+        except OSError:
+            pass
     
     def parse_gh_command(self, args: List[str]) -> Tuple[str, Dict]:
         """Parse gh command to understand what's being done"""
         if not args:
             return 'help', {}
-        
-        command_type = args[0] if args else 'help'
-        params = {}
-        
-        # Detect repo creation with clone
-        if command_type == 'repo' and len(args) > 1:
-            if args[1] == 'clone' and len(args) > 2:
-                params['action'] = 'clone'
-                params['repo'] = args[2]
-                params['size_check_needed'] = True
-                
-            elif args[1] == 'create':
-                params['action'] = 'create'
-                params['needs_upload'] = self.check_current_dir_size()
-                
-        # Detect release uploads
-        elif command_type == 'release' and len(args) > 1:
-            if args[1] == 'upload':
-                params['action'] = 'release_upload'
-                params['files'] = self.extract_files_from_args(args[2:])
-                params['large_files'] = self.check_large_files(params['files'])
-                
-        # Detect gist creation with large files
-        elif command_type == 'gist' and len(args) > 1:
-            if args[1] == 'create':
-                params['action'] = 'gist_create'
-                params['files'] = self.extract_files_from_args(args[2:])
-                params['large_files'] = self.check_large_files(params['files'])
-        
-        # Detect pr creation with large diffs
-        elif command_type == 'pr' and len(args) > 1:
-            if args[1] == 'create':
-                params['action'] = 'pr_create'
-                params['diff_size'] = self.get_git_diff_size()
-                
+
+        command_type = args[0]
+        parser = self._PARSERS.get(command_type)
+        params = parser(self, args) if parser and len(args) > 1 else {}
+
         return command_type, params
+
+    def _parse_repo(self, args: List[str]) -> Dict:
+        """Detect repo creation with clone"""
+        params = {}
+        if args[1] == 'clone' and len(args) > 2:
+            params['action'] = 'clone'
+            params['repo'] = args[2]
+            params['size_check_needed'] = True
+
+        elif args[1] == 'create':
+            params['action'] = 'create'
+            params['needs_upload'] = self.check_current_dir_size()
+
+        return params
+
+    def _parse_release(self, args: List[str]) -> Dict:
+        """Detect release uploads"""
+        params = {}
+        if args[1] == 'upload':
+            params['action'] = 'release_upload'
+            params['files'] = self.extract_files_from_args(args[2:])
+            params['large_files'] = self.check_large_files(params['files'])
+
+        return params
+
+    def _parse_gist(self, args: List[str]) -> Dict:
+        """Detect gist creation with large files"""
+        params = {}
+        if args[1] == 'create':
+            params['action'] = 'gist_create'
+            params['files'] = self.extract_files_from_args(args[2:])
+            params['large_files'] = self.check_large_files(params['files'])
+
+        return params
+
+    def _parse_pr(self, args: List[str]) -> Dict:
+        """Detect pr creation with large diffs"""
+        params = {}
+        if args[1] == 'create':
+            params['action'] = 'pr_create'
+            params['diff_size'] = self.get_git_diff_size()
+
+        return params
+
+    # Dispatch table built once at class creation - O(1) lookup per command
+    _PARSERS = {
+        'repo': _parse_repo,
+        'release': _parse_release,
+        'gist': _parse_gist,
+        'pr': _parse_pr,
+    }
     
     def check_current_dir_size(self) -> bool:
         """Check if current directory is large enough to need smart upload"""
         try:
-            result = subprocess.run(['du', '-sm', '.'], capture_output=True, text=True)
-            size_mb = int(result.stdout.split()[0])
-            threshold = self.config.get('auto_detect_threshold_mb', 10)
-            return size_mb > threshold
+            threshold_bytes = self.config.get('auto_detect_threshold_mb', 10) * 1024 * 1024
+            return self._dir_size_exceeds('.', threshold_bytes)
         except:
             return False
+
+    def _dir_size_exceeds(self, path: str, limit: int) -> bool:
+        """Walk a directory, stopping as soon as the size total passes the limit"""
+        total = 0
+        stack = [path]
+        while stack:
+            for entry in os.scandir(stack.pop()):
+                if entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+                    if total > limit:
+                        return True
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+        return False
     
     def extract_files_from_args(self, args: List[str]) -> List[str]:
         """Extract file paths from command arguments"""
@@ -111,38 +180,43 @@ class GitHubCLIInterceptor:
     def check_large_files(self, files: List[str]) -> List[Tuple[str, int]]:
         """Check for large files that need chunking"""
         large_files = []
-        threshold_mb = self.config.get('auto_detect_threshold_mb', 10)
-        
+        threshold_bytes = self.config.get('auto_detect_threshold_mb', 10) * 1024 * 1024
+
         for file_path in files:
             try:
-                size_mb = Path(file_path).stat().st_size / (1024 * 1024)
-                if size_mb > threshold_mb:
-                    large_files.append((file_path, size_mb))
-            except:
-                pass
-                
+                size = os.stat(file_path, follow_symlinks=False).st_size
+            except OSError:
+                continue
+            if size > threshold_bytes:
+                large_files.append((file_path, size / (1024 * 1024)))
+
         return large_files
     
     def get_git_diff_size(self) -> int:
         """Get the size of the current git diff in MB"""
         try:
-            result = subprocess.run(
-                ['git', 'diff', '--cached', '--stat'],
-                capture_output=True, text=True
-            )
-            # Parse the stat output for total size
-            lines = result.stdout.strip().split('\n')
-            if lines:
-                # Look for the summary line
-                for line in reversed(lines):
-                    if 'changed' in line or 'insertion' in line:
-                        # Extract numbers from the line
-                        numbers = re.findall(r'\d+', line)
-                        if numbers:
-                            # Rough estimate: assume each change is ~80 bytes
-                            total_changes = sum(int(n) for n in numbers)
-                            size_mb = (total_changes * 80) / (1024 * 1024)
-                            return int(size_mb)
+            threshold_bytes = self.config.get('auto_detect_threshold_mb', 10) * 1024 * 1024
+            total_changes = 0
+            with subprocess.Popen(
+                ['git', 'diff', '--cached', '--numstat'],
+                stdout=subprocess.PIPE, bufsize=-1
+            ) as proc:
+                # Each line is "added\tdeleted\tpath" - sum counts as they
+                # stream instead of buffering the whole diff output
+                for line in proc.stdout:
+                    fields = line.split(b'\t')
+                    if len(fields) >= 2:
+                        if fields[0].isdigit():
+                            total_changes += int(fields[0])
+                        if fields[1].isdigit():
+                            total_changes += int(fields[1])
+                    # Rough estimate: each changed line is ~80 bytes; stop
+                    # reading once the diff is clearly past the threshold
+                    if total_changes * 80 > threshold_bytes:
+                        proc.kill()
+                        break
+            size_mb = (total_changes * 80) / (1024 * 1024)
+            return int(size_mb)
         except:
             pass
         return 0
@@ -225,14 +299,14 @@ class GitHubCLIInterceptor:
         try:
             result = subprocess.run(
                 ['git', 'remote', 'get-url', 'origin'],
-                capture_output=True, text=True
+                capture_output=True
             )
-            url = result.stdout.strip()
+            url = result.stdout.strip().decode('utf-8', 'replace')
             if 'github.com' in url:
                 # Extract owner/repo from URL
-                match = re.search(r'github\.com[:/]([^/]+/[^/\.]+)', url)
+                match = GH_URL_RE.search(url)
                 if match:
-                    return match.group(1).replace('.git', '')
+                    return match.group(1)
         except:
             pass
         return None
@@ -272,6 +346,8 @@ class GitHubCLIInterceptor:
 
 def install_interceptor():
     """Install the interceptor as the default gh command"""
+    import shutil
+
     print("Installing GitHub CLI interceptor...")
     
     # Find current gh location
@@ -19,6 +19,25 @@ from watchdog.events import FileSystemEventHandler
 import logging
 import signal
 
+# On Linux a raw inotify descriptor with a narrow event mask beats
+# watchdog's observer, which subscribes to every event type and filters
+# in Python. Optional - watchdog remains the portable backend.
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+# orjson decodes several times faster than stdlib json; fall back quietly
+# when it isn't installed (it's an optional extra)
+try:
+    import orjson
+    _loads = orjson.loads
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,86 +49,212 @@ logging.basicConfig(
 )
 logger = logging.getLogger('HardCardMonitor')
 
+# Repo-size cache keyed on .git/objects mtime - warm hits cost one stat
+# instead of a git subprocess. Bounded so long-running monitors don't grow.
+_size_cache: Dict[str, tuple] = {}
+_SIZE_CACHE_MAX = 128
+
+# Background git must never contend with the user's own foreground git:
+# no index lock, no surprise auto-GC kicked off from a monitor process
+_GIT_ENV = {**os.environ, 'GIT_OPTIONAL_LOCKS': '0'}
+
+def _git(repo, *args) -> subprocess.CompletedProcess:
+    """Run git against a repo with locking and auto-GC disabled"""
+    return subprocess.run(
+        ['git', '--no-optional-locks', '-c', 'gc.auto=0', '-C', str(repo),
+         *args],
+        capture_output=True, text=True, env=_GIT_ENV
+    )
+
+def git_size_mb(repo_path) -> int:
+    """Get the packed repository size in MB by statting pack files directly
+
+    Only object size matters for push bandwidth. Summing .pack/.idx sizes
+    with one scandir pass costs a couple of dozen syscalls and no fork at
+    all - no du over the worktree, no git subprocess.
+    """
+    try:
+        key = str(repo_path)
+        objects_dir = os.path.join(key, '.git', 'objects')
+        try:
+            mtime_ns = os.stat(objects_dir).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        if mtime_ns is not None:
+            cached = _size_cache.get(key)
+            if cached and cached[0] == mtime_ns:
+                return cached[1]
+
+        total = 0
+        try:
+            with os.scandir(os.path.join(objects_dir, 'pack')) as it:
+                for entry in it:
+                    if entry.name.endswith(('.pack', '.idx')):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
+
+        if total == 0:
+            # Nothing packed yet - fresh repos keep everything loose, so
+            # fall back to count-objects (via the lock-safe helper)
+            result = _git(key, 'count-objects', '-v')
+            for line in result.stdout.splitlines():
+                if line.startswith(('size:', 'size-pack:')):
+                    total += int(line.split(':', 1)[1]) * 1024
+        size_mb = total >> 20
+
+        if mtime_ns is not None:
+            if len(_size_cache) >= _SIZE_CACHE_MAX:
+                _size_cache.pop(next(iter(_size_cache)))
+            _size_cache[key] = (mtime_ns, size_mb)
+
+        return size_mb
+    except:
+        return 0
+
 class GitOperationMonitor(FileSystemEventHandler):
     """Monitors file system for Git operations"""
     
+    DEBOUNCE_SECONDS = 0.5
+
+    # Files the hub itself writes into .git - ignore them or our own
+    # updates would feed back through the watcher as fresh events
+    _IGNORED_NAMES = {'hardcard-smart-suggested', 'hardcard-smart-suggested.tmp'}
+
     def __init__(self, config: Dict):
         self.config = config
         self.monitored_repos: Set[Path] = set()
         self.active_operations: Dict[str, Dict] = {}
         self.threshold_mb = config.get('auto_detect_threshold_mb', 10)
-        
+        # Event debouncing - a single push touches .git dozens of times, so
+        # coalesce bursts into one check per repo per window
+        self._pending: Dict[Path, float] = {}
+        self._pending_lock = threading.Lock()
+        self._debounce_timer: Optional[threading.Timer] = None
+        # Known repo roots, longest first, so event-to-repo resolution is a
+        # string prefix check instead of a stat() walk up every ancestor
+        self._repo_roots: List[str] = []
+        # Push-probe results memoized per (repo, 500ms bucket) so an event
+        # storm costs one PUSH_HEAD/ORIG_HEAD stat pair, not one per event
+        self._push_probe_cache: Dict[tuple, bool] = {}
+        # Precomputed marker for the .git guard - a C-level substring scan
+        # instead of PurePath.parts splitting the path on every event
+        self._git_marker = os.sep + '.git' + os.sep
+
     def on_modified(self, event):
         """Handle file modification events"""
         if event.is_directory:
             return
-            
-        path = Path(event.src_path)
-        
-        # Check if this is a git operation
-        if '.git' in path.parts:
-            self.check_git_operation(path)
-            
-    def check_git_operation(self, path: Path):
+
+        self.handle_path(event.src_path)
+
+    def handle_path(self, src_path: str):
+        """Common guard and dispatch for both watcher backends"""
+        # Watches are scoped to .git internals, so this guard is nearly
+        # always true - but it's a single substring scan, and it protects
+        # against stray events if the handler is ever attached elsewhere
+        if self._git_marker not in src_path:
+            return
+
+        if os.path.basename(src_path) in self._IGNORED_NAMES:
+            return
+
+        self.queue_git_check(src_path)
+
+    def register_repo_root(self, repo_root: Path):
+        """Record a repo root discovered by the service's watch scan"""
+        root = str(repo_root)
+        if root not in self._repo_roots:
+            self._repo_roots.append(root)
+            self._repo_roots.sort(key=len, reverse=True)
+
+    def resolve_repo_root(self, path: str) -> Optional[Path]:
+        """Map an event path to its repo root with zero syscalls"""
+        for root in self._repo_roots:
+            if path.startswith(root + os.sep):
+                return Path(root)
+        return None
+
+    def queue_git_check(self, path: str):
+        """Queue a repo for checking, coalescing bursts of events"""
+        repo_root = self.resolve_repo_root(path)
+        if not repo_root:
+            return
+
+        with self._pending_lock:
+            self._pending[repo_root] = time.time()
+            if self._debounce_timer is None:
+                self._debounce_timer = threading.Timer(
+                    self.DEBOUNCE_SECONDS, self._drain_pending
+                )
+                self._debounce_timer.daemon = True
+                self._debounce_timer.start()
+
+    def _drain_pending(self):
+        """Process each queued repo once, then disarm the timer"""
+        with self._pending_lock:
+            repos = list(self._pending)
+            self._pending.clear()
+            self._debounce_timer = None
+
+        for repo_root in repos:
+            self.check_git_operation(repo_root)
+
+    def check_git_operation(self, repo_root: Path):
         """Check if a git operation needs smart upload"""
         try:
-            # Find the repository root
-            repo_root = self.find_repo_root(path)
-            if not repo_root:
-                return
-                
             # Check if this repo is being pushed
             if self.is_push_operation(repo_root):
                 # Check repository size
                 size_mb = self.get_repo_size(repo_root)
-                
+
                 if size_mb > self.threshold_mb:
                     self.notify_smart_upload_needed(repo_root, size_mb)
-                    
+
         except Exception as e:
             logger.error(f"Error checking git operation: {e}")
     
-    def find_repo_root(self, path: Path) -> Optional[Path]:
-        """Find the root of a git repository"""
-        current = path.parent if path.is_file() else path
-        
-        while current != current.parent:
-            if (current / '.git').exists():
-                return current
-            current = current.parent
-            
-        return None
-    
     def is_push_operation(self, repo_root: Path) -> bool:
         """Check if a push operation is in progress"""
-        # Check for push-related git files
+        # 500ms buckets match the debounce window
+        bucket = int(time.time() * 2)
+        key = (repo_root, bucket)
+        cached = self._push_probe_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._probe_push_files(repo_root)
+
+        # Drop stale buckets so the cache stays a handful of entries
+        self._push_probe_cache = {
+            k: v for k, v in self._push_probe_cache.items()
+            if k[1] >= bucket - 2
+        }
+        self._push_probe_cache[key] = result
+        return result
+
+    def _probe_push_files(self, repo_root: Path) -> bool:
+        """Stat the push marker files under .git"""
         git_dir = repo_root / '.git'
-        
+
         indicators = [
             git_dir / 'PUSH_HEAD',
             git_dir / 'ORIG_HEAD',
         ]
-        
+
         for indicator in indicators:
             if indicator.exists():
                 # Check if file was recently modified (within last 5 seconds)
                 mtime = indicator.stat().st_mtime
                 if time.time() - mtime < 5:
                     return True
-                    
+
         return False
     
     def get_repo_size(self, repo_root: Path) -> int:
         """Get repository size in MB"""
-        try:
-            result = subprocess.run(
-                ['du', '-sm', str(repo_root)],
-                capture_output=True, text=True
-            )
-            size_mb = int(result.stdout.split()[0])
-            return size_mb
-        except:
-            return 0
+        return git_size_mb(repo_root)
     
     def notify_smart_upload_needed(self, repo_root: Path, size_mb: int):
         """Notify user that smart upload should be used"""
@@ -135,11 +280,18 @@ class GitOperationMonitor(FileSystemEventHandler):
 class ProcessMonitor:
     """Monitors system processes for git/gh operations"""
     
+    # Only these command names warrant reading cmdline at all
+    _GIT_NAMES = {'git', 'git-remote-https', 'git-remote-http'}
+
     def __init__(self, config: Dict):
         self.config = config
         self.monitoring = False
         self.monitored_pids: Set[int] = set()
-        
+        self._prev_pids: Set[int] = set()
+        # Reused read buffer - /proc files are tiny, so one preadv into a
+        # preallocated buffer per file avoids a fresh allocation per PID
+        self._read_buf = bytearray(4096)
+
     def start(self):
         """Start monitoring processes"""
         self.monitoring = True
@@ -160,7 +312,70 @@ class ProcessMonitor:
                 logger.error(f"Process monitoring error: {e}")
                 
     def check_processes(self):
-        """Check running processes for git operations"""
+        """Check newly started processes for git operations
+
+        Diffs the /proc PID list against the previous tick, so only new
+        processes pay the per-PID read cost. comm is read first (a single
+        ~16 byte read) and cmdline only for matching names, instead of
+        opening stat + cmdline for every process on the box every 2 seconds.
+        """
+        try:
+            # listdir + filter/map keeps the whole scan in C: no DirEntry
+            # objects and no per-entry Python bytecode for the filter
+            cur_pids = set(map(int, filter(str.isdigit, os.listdir('/proc'))))
+        except OSError:
+            # No /proc here (macOS) - fall back to the psutil snapshot
+            self._check_processes_psutil()
+            return
+
+        new_pids = cur_pids - self._prev_pids
+        self._prev_pids = cur_pids
+
+        for pid in new_pids:
+            if pid in self.monitored_pids:
+                continue
+            data = self._read_proc_file(f'/proc/{pid}/comm')
+            if data is None:
+                continue  # Process already gone
+            name = data.rstrip(b'\n').decode()
+
+            if name not in self._GIT_NAMES and name != 'gh':
+                continue
+
+            data = self._read_proc_file(f'/proc/{pid}/cmdline')
+            if data is None:
+                continue
+            cmdline = data.decode('utf-8', 'replace').split('\0')
+
+            try:
+                if name in self._GIT_NAMES:
+                    if any('push' in arg for arg in cmdline):
+                        self.handle_git_push(psutil.Process(pid), cmdline)
+                elif any(cmd in cmdline for cmd in ['repo', 'release', 'gist']):
+                    self.handle_gh_operation(psutil.Process(pid), cmdline)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+    def _read_proc_file(self, path: str) -> Optional[bytes]:
+        """Read a small /proc file with raw syscalls into the shared buffer
+
+        open + preadv + close, no Python file object or per-read allocation.
+        Returns None if the process vanished between the scan and the read.
+        """
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            n = os.preadv(fd, [self._read_buf], 0)
+            return bytes(self._read_buf[:n])
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+
+    def _check_processes_psutil(self):
+        """Full-snapshot scan for platforms without a /proc filesystem"""
         for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
             try:
                 info = proc.info
@@ -209,42 +424,46 @@ class ProcessMonitor:
         
     def get_directory_size(self, path: str) -> int:
         """Get directory size in MB"""
-        try:
-            result = subprocess.run(
-                ['du', '-sm', path],
-                capture_output=True, text=True
-            )
-            return int(result.stdout.split()[0])
-        except:
-            return 0
+        return git_size_mb(path)
             
     def suggest_smart_upload(self, repo_path: str, size_mb: int):
         """Suggest using smart upload"""
-        # Create a file that git-smart can detect
+        # Create a file that git-smart can detect. Write to a temp name and
+        # rename so our own watcher sees one atomic event, not a cascade of
+        # create/write/close events mid-update
         flag_file = Path(repo_path) / '.git' / 'hardcard-smart-suggested'
-        flag_file.write_text(json.dumps({
+        tmp_file = flag_file.with_name(flag_file.name + '.tmp')
+        tmp_file.write_text(_dumps({
             'timestamp': datetime.now().isoformat(),
             'size_mb': size_mb,
             'suggested': True
         }))
+        os.replace(tmp_file, flag_file)
 
 class HardCardHubService:
     """Main service coordinator"""
-    
+
+    RESCAN_INTERVAL = 300  # seconds between scans for newly created repos
+
     def __init__(self):
         self.config = self.load_config()
         self.file_monitor = GitOperationMonitor(self.config)
         self.process_monitor = ProcessMonitor(self.config)
         self.observer = Observer()
         self.running = False
+        self._watched_gitdirs: Set[Path] = set()
+        self._rescan_timer: Optional[threading.Timer] = None
+        self._stop_event = threading.Event()
+        self._inotify = None
+        self._inotify_wds: Dict[int, str] = {}
+        self._inotify_thread: Optional[threading.Thread] = None
         
     def load_config(self) -> Dict:
         """Load service configuration"""
         config_path = Path.home() / '.hardcard-hub' / 'config.json'
         
         if config_path.exists():
-            with open(config_path) as f:
-                return json.load(f)
+            return _loads(config_path.read_bytes())
                 
         return {
             'auto_detect_threshold_mb': 10,
@@ -263,14 +482,25 @@ class HardCardHubService:
         logger.info("Starting HardCard Hub Monitor Service")
         self.running = True
         
-        # Start file monitoring
+        # Start file monitoring - watch each repo's .git directory rather
+        # than whole monitor trees, so unrelated source edits and build
+        # artefacts never generate events
         if self.config.get('file_monitoring', True):
-            for path in self.config.get('monitor_paths', []):
-                if Path(path).exists():
-                    self.observer.schedule(self.file_monitor, path, recursive=True)
-                    logger.info(f"Monitoring path: {path}")
-                    
-            self.observer.start()
+            if INotify is not None and sys.platform.startswith('linux'):
+                # Narrow mask: we only care that a push indicator or ref
+                # finished being written, not every IN_MODIFY in between
+                self._inotify = INotify()
+                self.schedule_git_watches()
+                self._inotify_thread = threading.Thread(
+                    target=self._inotify_loop, daemon=True
+                )
+                self._inotify_thread.start()
+                logger.info("File monitoring backend: inotify")
+            else:
+                self.schedule_git_watches()
+                self.observer.start()
+                logger.info("File monitoring backend: watchdog")
+            self._arm_rescan_timer()
             
         # Start process monitoring
         if self.config.get('process_monitoring', True):
@@ -283,20 +513,103 @@ class HardCardHubService:
         
         logger.info("HardCard Hub Monitor is running")
         
-        # Keep service running
+        # Block until shutdown - no periodic wakeups, the watchers and
+        # timers all run on their own threads
         try:
-            while self.running:
-                time.sleep(1)
+            self._stop_event.wait()
         except KeyboardInterrupt:
             self.stop()
             
+    def discover_git_dirs(self) -> List[Path]:
+        """Find .git directories under the configured monitor paths"""
+        git_dirs = []
+        for path in self.config.get('monitor_paths', []):
+            root = Path(path)
+            if not root.exists():
+                continue
+            for gitdir in root.rglob('.git'):
+                if gitdir.is_dir():
+                    git_dirs.append(gitdir)
+        return git_dirs
+
+    def schedule_git_watches(self):
+        """Watch repo .git internals instead of whole directory trees
+
+        Push activity shows up under refs/ and objects/pack/, plus marker
+        files like PUSH_HEAD directly inside .git, so three non-recursive
+        watches per repo cover everything we care about with a handful of
+        inotify descriptors.
+        """
+        for gitdir in self.discover_git_dirs():
+            resolved = gitdir.resolve()
+            if resolved in self._watched_gitdirs:
+                continue
+            self._watched_gitdirs.add(resolved)
+
+            for watch_dir in (resolved, resolved / 'refs',
+                              resolved / 'objects' / 'pack'):
+                if watch_dir.is_dir():
+                    if self._inotify is not None:
+                        wd = self._inotify.add_watch(
+                            str(watch_dir),
+                            inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO
+                        )
+                        self._inotify_wds[wd] = str(watch_dir)
+                    else:
+                        self.observer.schedule(
+                            self.file_monitor, str(watch_dir), recursive=False
+                        )
+            self.file_monitor.register_repo_root(resolved.parent)
+            logger.info(f"Monitoring repository: {resolved.parent}")
+
+    def _inotify_loop(self):
+        """Dispatch narrow-mask inotify events to the file monitor"""
+        while self.running:
+            try:
+                events = self._inotify.read(timeout=1000)
+            except OSError:
+                break
+            for event in events:
+                if event.mask & inotify_flags.ISDIR or not event.name:
+                    continue
+                watch_dir = self._inotify_wds.get(event.wd)
+                if watch_dir:
+                    self.file_monitor.handle_path(
+                        os.path.join(watch_dir, event.name)
+                    )
+
+    def _arm_rescan_timer(self):
+        """Schedule the next scan for repositories created after startup"""
+        self._rescan_timer = threading.Timer(self.RESCAN_INTERVAL, self._rescan)
+        self._rescan_timer.daemon = True
+        self._rescan_timer.start()
+
+    def _rescan(self):
+        """Pick up newly created repos without restarting the service"""
+        if not self.running:
+            return
+        try:
+            self.schedule_git_watches()
+        except Exception as e:
+            logger.error(f"Repository rescan failed: {e}")
+        self._arm_rescan_timer()
+
     def stop(self):
         """Stop the monitoring service"""
         logger.info("Stopping HardCard Hub Monitor Service")
         self.running = False
-        
-        self.observer.stop()
-        self.observer.join()
+        self._stop_event.set()
+
+        if self._rescan_timer is not None:
+            self._rescan_timer.cancel()
+
+        if self._inotify is not None:
+            self._inotify.close()
+            if self._inotify_thread is not None:
+                self._inotify_thread.join(timeout=2)
+        else:
+            self.observer.stop()
+            self.observer.join()
         
         self.process_monitor.stop()
         
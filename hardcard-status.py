@@ -6,11 +6,21 @@ Shows if the smart upload system is active and working
 
 import os
 import json
+import asyncio
+import sqlite3
 import subprocess
 import sys
 from pathlib import Path
 from datetime import datetime
 
+# orjson decodes several times faster than stdlib json; fall back quietly
+# when it isn't installed (it's an optional extra)
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 class Colors:
     GREEN = '\033[0;32m'
     RED = '\033[0;31m'
@@ -49,46 +59,97 @@ def check_installation():
     
     return all_installed
 
-def check_git_integration():
+class GitServer:
+    """Persistent `git cat-file --batch-check` process for object queries
+
+    One long-lived git process answers any number of queries over a pipe,
+    amortizing git's startup cost (config parse, odb setup) instead of
+    paying a fork/exec per object. Callers must close() when done.
+    """
+
+    def __init__(self, repo='.'):
+        self._proc = subprocess.Popen(
+            ['git', '-C', repo, 'cat-file',
+             '--batch-check=%(objectsize:disk)'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+
+    def object_size(self, ref):
+        """On-disk size of an object, or None if the ref doesn't resolve"""
+        try:
+            self._proc.stdin.write(ref.encode() + b'\n')
+            self._proc.stdin.flush()
+            reply = self._proc.stdout.readline().strip()
+            return int(reply) if reply.isdigit() else None
+        except (OSError, ValueError):
+            return None
+
+    def close(self):
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=2)
+        except Exception:
+            self._proc.kill()
+
+async def run_command(argv, timeout=None):
+    """Run a subprocess without blocking the other status checks"""
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        raise
+    return proc.returncode, stdout.decode()
+
+async def check_git_integration():
     """Check Git integration status"""
-    print(f"\n{Colors.BOLD}🔗 Git Integration:{Colors.ENDC}")
-    
-    # Check git-smart alias
+    lines = [f"\n{Colors.BOLD}🔗 Git Integration:{Colors.ENDC}"]
+
+    # One git config --list call covers both lookups - each separate
+    # `git config <key>` is a full git startup and config parse
     try:
-        result = subprocess.run(['git', 'config', 'alias.smart'], 
-                               capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"  {Colors.GREEN}✅ Configured{Colors.ENDC} Git alias 'git smart' → git-smart")
-        else:
-            print(f"  {Colors.RED}❌ Missing{Colors.ENDC}    Git alias not configured")
+        _, stdout = await run_command(['git', 'config', '--list', '-z'])
+        config = dict(
+            item.split('\n', 1) for item in stdout.split('\0')
+            if '\n' in item
+        )
     except:
-        print(f"  {Colors.RED}❌ Error{Colors.ENDC}      Could not check Git configuration")
-    
+        lines.append(f"  {Colors.RED}❌ Error{Colors.ENDC}      Could not check Git configuration")
+        return '\n'.join(lines)
+
+    # Check git-smart alias
+    if 'alias.smart' in config:
+        lines.append(f"  {Colors.GREEN}✅ Configured{Colors.ENDC} Git alias 'git smart' → git-smart")
+    else:
+        lines.append(f"  {Colors.RED}❌ Missing{Colors.ENDC}    Git alias not configured")
+
     # Check global hooks path
-    try:
-        result = subprocess.run(['git', 'config', 'core.hooksPath'], 
-                               capture_output=True, text=True)
-        hooks_path = result.stdout.strip()
-        if hooks_path:
-            print(f"  {Colors.GREEN}✅ Configured{Colors.ENDC} Global hooks: {hooks_path}")
-        else:
-            print(f"  {Colors.YELLOW}⚠️  Default{Colors.ENDC}    Using repository-specific hooks")
-    except:
-        print(f"  {Colors.RED}❌ Error{Colors.ENDC}      Could not check hooks configuration")
+    hooks_path = config.get('core.hookspath', '').strip()
+    if hooks_path:
+        lines.append(f"  {Colors.GREEN}✅ Configured{Colors.ENDC} Global hooks: {hooks_path}")
+    else:
+        lines.append(f"  {Colors.YELLOW}⚠️  Default{Colors.ENDC}    Using repository-specific hooks")
 
-def check_current_repo():
+    return '\n'.join(lines)
+
+async def check_current_repo():
     """Check if current directory is a Git repository and analyze it"""
-    print(f"\n{Colors.BOLD}📁 Current Repository Analysis:{Colors.ENDC}")
-    
+    lines = [f"\n{Colors.BOLD}📁 Current Repository Analysis:{Colors.ENDC}"]
+
     if not Path('.git').exists():
-        print(f"  {Colors.YELLOW}ℹ️  Not in a Git repository{Colors.ENDC}")
-        return
-    
+        lines.append(f"  {Colors.YELLOW}ℹ️  Not in a Git repository{Colors.ENDC}")
+        return '\n'.join(lines)
+
     # Get repository size
     try:
-        result = subprocess.run(['du', '-sm', '.'], capture_output=True, text=True)
-        size_mb = int(result.stdout.split()[0])
-        
+        _, stdout = await run_command(['du', '-sm', '.'])
+        size_mb = int(stdout.split()[0])
+
         if size_mb > 50:
             color = Colors.RED
             recommendation = "🚨 Use 'git-smart push' for uploads"
@@ -99,84 +160,154 @@ def check_current_repo():
             color = Colors.GREEN
             recommendation = "✅ Regular git push should work fine"
         
-        print(f"  {color}Repository size: {size_mb}MB{Colors.ENDC}")
-        print(f"  {recommendation}")
-        
-        # Check for large files
+        lines.append(f"  {color}Repository size: {size_mb}MB{Colors.ENDC}")
+        lines.append(f"  {recommendation}")
+
+        # Check for large files - manual scandir walk that skips .git and
+        # stops after 6 hits, since we only print the top 5 plus "more"
         large_files = []
-        for file_path in Path('.').rglob('*'):
-            if file_path.is_file() and not '.git' in file_path.parts:
-                try:
-                    size_mb = file_path.stat().st_size / (1024 * 1024)
-                    if size_mb > 10:
-                        large_files.append((str(file_path), size_mb))
-                except:
-                    pass
-        
+        threshold = 10 * 1024 * 1024
+        stack = ['.']
+        while stack and len(large_files) < 6:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name == '.git':
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            size = entry.stat(follow_symlinks=False).st_size
+                            if size > threshold:
+                                large_files.append(
+                                    (entry.path, size / (1024 * 1024)))
+                                if len(large_files) >= 6:
+                                    break
+                    except OSError:
+                        pass
+
         if large_files:
-            print(f"\n  {Colors.BOLD}📦 Large Files Detected:{Colors.ENDC}")
+            lines.append(f"\n  {Colors.BOLD}📦 Large Files Detected:{Colors.ENDC}")
+            # One persistent cat-file process answers all the "is this
+            # committed?" queries instead of one git fork per file
+            git_server = GitServer()
             for file_path, size_mb in large_files[:5]:  # Show top 5
-                print(f"    {Colors.YELLOW}⚠️  {size_mb:6.1f}MB{Colors.ENDC} {file_path}")
-            
+                rel_path = file_path[2:] if file_path.startswith('./') else file_path
+                committed = git_server.object_size(f'HEAD:{rel_path}') is not None
+                note = ' (committed)' if committed else ''
+                lines.append(f"    {Colors.YELLOW}⚠️  {size_mb:6.1f}MB{Colors.ENDC} {file_path}{note}")
+            git_server.close()
+
             if len(large_files) > 5:
-                print(f"    ... and {len(large_files) - 5} more")
-                
+                lines.append(f"    ... and more")
+
     except Exception as e:
-        print(f"  {Colors.RED}❌ Error analyzing repository: {e}{Colors.ENDC}")
+        lines.append(f"  {Colors.RED}❌ Error analyzing repository: {e}{Colors.ENDC}")
 
-def check_network_connectivity():
+    return '\n'.join(lines)
+
+async def check_network_connectivity():
     """Check network connectivity for uploads"""
-    print(f"\n{Colors.BOLD}🌐 Network Status:{Colors.ENDC}")
-    
+    lines = [f"\n{Colors.BOLD}🌐 Network Status:{Colors.ENDC}"]
+
     try:
-        # Test GitHub connectivity
-        result = subprocess.run(['ping', '-c', '1', 'github.com'], 
-                               capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            print(f"  {Colors.GREEN}✅ Connected{Colors.ENDC}  GitHub.com is reachable")
-        else:
-            print(f"  {Colors.RED}❌ Failed{Colors.ENDC}     Cannot reach GitHub.com")
-            
-    except subprocess.TimeoutExpired:
-        print(f"  {Colors.YELLOW}⚠️  Timeout{Colors.ENDC}    Network test timed out")
+        # Test GitHub connectivity with a TCP connect to port 443 - the
+        # port git actually uses. No fork, no ICMP (which containers and
+        # some firewalls block), and a deterministic sub-second timeout.
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection('github.com', 443), timeout=2.0)
+        writer.close()
+        lines.append(f"  {Colors.GREEN}✅ Connected{Colors.ENDC}  GitHub.com is reachable")
+
+    except asyncio.TimeoutError:
+        lines.append(f"  {Colors.YELLOW}⚠️  Timeout{Colors.ENDC}    Network test timed out")
+    except OSError:
+        lines.append(f"  {Colors.RED}❌ Failed{Colors.ENDC}     Cannot reach GitHub.com")
     except Exception as e:
-        print(f"  {Colors.RED}❌ Error{Colors.ENDC}      Network test failed: {e}")
-    
+        lines.append(f"  {Colors.RED}❌ Error{Colors.ENDC}      Network test failed: {e}")
+
     # Check GitHub token
     github_token = os.environ.get('GITHUB_TOKEN')
     if github_token:
-        print(f"  {Colors.GREEN}✅ Found{Colors.ENDC}      GitHub token in environment")
+        lines.append(f"  {Colors.GREEN}✅ Found{Colors.ENDC}      GitHub token in environment")
     else:
-        print(f"  {Colors.YELLOW}⚠️  Missing{Colors.ENDC}    GITHUB_TOKEN environment variable not set")
+        lines.append(f"  {Colors.YELLOW}⚠️  Missing{Colors.ENDC}    GITHUB_TOKEN environment variable not set")
+
+    return '\n'.join(lines)
+
+def sync_sessions_db(sessions_dir):
+    """Mirror the per-session JSON files into a single sqlite index
+
+    Listing sessions from one db read replaces an open+read+parse per
+    file. JSON stays the write format (the upload manager owns it); only
+    files whose mtime changed since the last run are re-imported here.
+    """
+    db = sqlite3.connect(sessions_dir / 'sessions.db')
+    db.execute(
+        'CREATE TABLE IF NOT EXISTS sessions ('
+        'session_id TEXT PRIMARY KEY, repo_name TEXT, '
+        'progress REAL, mtime_ns INTEGER)'
+    )
+    known = dict(db.execute('SELECT session_id, mtime_ns FROM sessions'))
+
+    seen = set()
+    for session_file in sessions_dir.glob('*.json'):
+        try:
+            mtime_ns = session_file.stat().st_mtime_ns
+            seen.add(session_file.stem)
+            if known.get(session_file.stem) == mtime_ns:
+                continue
+            session_data = _loads(session_file.read_bytes())
+            db.execute(
+                'INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?)',
+                (session_file.stem,
+                 session_data.get('repo_name', 'unknown'),
+                 session_data.get('progress_percentage', 0),
+                 mtime_ns)
+            )
+        except Exception:
+            continue
+
+    # A session whose backing file is gone is no longer active; drop its
+    # row so deletions show up immediately, as the per-file scan did
+    stale = known.keys() - seen
+    if stale:
+        db.executemany('DELETE FROM sessions WHERE session_id = ?',
+                       [(session_id,) for session_id in stale])
+
+    db.commit()
+    return db
 
 def show_active_sessions():
     """Show any active upload sessions"""
     sessions_dir = Path.home() / '.hardcard-hub' / 'sessions'
-    
+
     if not sessions_dir.exists():
         return
-    
-    session_files = list(sessions_dir.glob('*.json'))
-    
-    if session_files:
+
+    try:
+        db = sync_sessions_db(sessions_dir)
+        rows = db.execute(
+            'SELECT session_id, repo_name, progress FROM sessions '
+            'ORDER BY mtime_ns DESC LIMIT 5'
+        ).fetchall()
+        db.close()
+    except sqlite3.Error:
+        return
+
+    if rows:
         print(f"\n{Colors.BOLD}📤 Active Upload Sessions:{Colors.ENDC}")
-        
-        for session_file in session_files[:5]:  # Show up to 5
-            try:
-                with open(session_file) as f:
-                    session_data = json.load(f)
-                
-                session_id = session_data.get('session_id', 'unknown')[:12]
-                repo_name = session_data.get('repo_name', 'unknown')
-                progress = session_data.get('progress_percentage', 0)
-                
-                if progress < 100:
-                    print(f"  {Colors.YELLOW}⏳ In Progress{Colors.ENDC} {session_id} → {repo_name} ({progress:.0f}%)")
-                else:
-                    print(f"  {Colors.GREEN}✅ Complete{Colors.ENDC}   {session_id} → {repo_name} (100%)")
-                    
-            except Exception as e:
-                print(f"  {Colors.RED}❌ Error{Colors.ENDC}      Could not read session {session_file.name}")
+
+        for session_id, repo_name, progress in rows:
+            session_id = session_id[:12]
+            if progress < 100:
+                print(f"  {Colors.YELLOW}⏳ In Progress{Colors.ENDC} {session_id} → {repo_name} ({progress:.0f}%)")
+            else:
+                print(f"  {Colors.GREEN}✅ Complete{Colors.ENDC}   {session_id} → {repo_name} (100%)")
 
 def show_recommendations():
     """Show actionable recommendations"""
@@ -194,18 +325,30 @@ def show_recommendations():
         print(f"  {Colors.CYAN}📈 Monitor:{Colors.ENDC}        hardcard-hub status --session SESSION_ID")
         print(f"  {Colors.CYAN}🔄 Resume:{Colors.ENDC}         hardcard-hub resume --session SESSION_ID")
 
+async def run_checks():
+    """Run the subprocess-bound checks concurrently, in display order
+
+    The git probes, the du scan and the network test are independent
+    I/O-bound operations, so total wall time is the slowest one instead
+    of the sum. gather preserves argument order for the output.
+    """
+    return await asyncio.gather(
+        check_git_integration(),
+        check_current_repo(),
+        check_network_connectivity(),
+    )
+
 def main():
     """Main status check function"""
     print_header()
-    
+
     # Run all checks
     is_installed = check_installation()
-    check_git_integration()
-    check_current_repo()
-    check_network_connectivity()
+    for block in asyncio.run(run_checks()):
+        print(block)
     show_active_sessions()
     show_recommendations()
-    
+
     # Overall status
     print(f"\n{Colors.BOLD}🎯 Overall Status:{Colors.ENDC}")
     
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Linux-specific fast paths for HardCard Smart Hub
+Portable stdlib fallbacks keep every caller working elsewhere
+"""
+
+import ctypes
+import functools
+import os
+import sys
+
+# statx constants from linux/stat.h
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_MTIME = 0x0040
+STATX_SIZE = 0x0200
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ('tv_sec', ctypes.c_longlong),
+        ('tv_nsec', ctypes.c_uint),
+        ('_reserved', ctypes.c_int),
+    ]
+
+class _StatxBuf(ctypes.Structure):
+    # struct statx, padded generously at the tail so newer kernels that
+    # append fields never write past our buffer
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint),
+        ('stx_blksize', ctypes.c_uint),
+        ('stx_attributes', ctypes.c_ulonglong),
+        ('stx_nlink', ctypes.c_uint),
+        ('stx_uid', ctypes.c_uint),
+        ('stx_gid', ctypes.c_uint),
+        ('stx_mode', ctypes.c_ushort),
+        ('_spare0', ctypes.c_ushort),
+        ('stx_ino', ctypes.c_ulonglong),
+        ('stx_size', ctypes.c_ulonglong),
+        ('stx_blocks', ctypes.c_ulonglong),
+        ('stx_attributes_mask', ctypes.c_ulonglong),
+        ('stx_atime', _StatxTimestamp),
+        ('stx_btime', _StatxTimestamp),
+        ('stx_ctime', _StatxTimestamp),
+        ('stx_mtime', _StatxTimestamp),
+        ('_tail', ctypes.c_ulonglong * 32),
+    ]
+
+@functools.lru_cache(maxsize=1)
+def _libc_statx():
+    """Resolve libc statx once per process; None when unavailable"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL('libc.so.6', use_errno=True)
+        return libc.statx
+    except (OSError, AttributeError):
+        return None
+
+def fast_mtime_size(path):
+    """Return (mtime_ns, size) for a path as cheaply as the OS allows
+
+    On Linux this is a statx call with AT_STATX_DONT_SYNC asking for just
+    STATX_MTIME|STATX_SIZE, so the kernel can answer from cached metadata
+    without forcing a sync. Elsewhere it's a plain os.stat. Raises
+    OSError for missing paths either way.
+    """
+    statx = _libc_statx()
+    if statx is not None:
+        buf = _StatxBuf()
+        rc = statx(AT_FDCWD, os.fsencode(path), AT_STATX_DONT_SYNC,
+                   STATX_MTIME | STATX_SIZE, ctypes.byref(buf))
+        if rc == 0:
+            mtime_ns = (buf.stx_mtime.tv_sec * 1_000_000_000
+                        + buf.stx_mtime.tv_nsec)
+            return mtime_ns, buf.stx_size
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno), path)
+
+    st = os.stat(path, follow_symlinks=False)
+    return st.st_mtime_ns, st.st_size
@@ -19,16 +19,113 @@ from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 import subprocess
 import logging
+import itertools
+from operator import attrgetter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import zipfile
 import tarfile
 import base64
+import binascii
+import fnmatch
+import mmap
+import queue
+import re
+import shutil
 from tqdm import tqdm
 import requests
-from github import Github, GithubException, RateLimitExceededException
+from github import Github
 import git
 from collections import defaultdict
 
+# GitHub REST API root used by the batched Git Data upload path
+GITHUB_API_URL = 'https://api.github.com'
+
+# msgpack trades JSON for a denser C-implemented codec; opt-in via
+# SESSION_MSGPACK=1 so existing .json sessions keep working
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+_SESSION_MSGPACK = msgpack is not None and os.environ.get('SESSION_MSGPACK') == '1'
+
+# orjson encodes in C when the 'fast' extra is installed
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Prefer a SHA-NI-accelerated digest when one is installed. Recent
+# Python/OpenSSL builds dispatch hashlib.sha256 to the SHA extensions
+# already, but older stacks fall back to scalar code at a 4-5x penalty.
+try:
+    from isal import isal_crypto as _isal_crypto
+    _sha256 = _isal_crypto.sha256
+except ImportError:
+    _sha256 = hashlib.sha256
+
+# Multi-buffer SIMD lanes digest 8 independent buffers per instruction
+# stream when the optional extension is built; chunk hashing is exactly
+# that shape, so batches route through it when present.
+try:
+    import sha256_mb as _sha256_mb
+except ImportError:
+    _sha256_mb = None
+
+# Chunk digests default to SHA-256 but honour CHUNK_HASH=blake3 when
+# that package is installed — its tree mode runs AVX2/AVX-512 kernels
+# internally, with no Python-level loop.
+_CHUNK_HASH = os.environ.get('CHUNK_HASH', 'sha256')
+if _CHUNK_HASH == 'blake3':
+    try:
+        from blake3 import blake3 as _chunk_digest
+    except ImportError:
+        _CHUNK_HASH = 'sha256'
+        _chunk_digest = _sha256
+else:
+    _chunk_digest = _sha256
+
+def _sha256_batch(views: List[Any], executor: Optional[ThreadPoolExecutor] = None) -> List[str]:
+    """Digest many independent buffers as one batch
+
+    Uses the 8-lane multi-buffer extension when available, otherwise
+    spreads the batch across the thread pool (hashlib drops the GIL on
+    large buffers) and finally falls back to a serial loop.
+    """
+    if _sha256_mb is not None and _CHUNK_HASH == 'sha256':
+        digests = []
+        for i in range(0, len(views), 8):
+            digests.extend(_sha256_mb.sha256_mb8(list(views[i:i + 8])))
+        return [d.hex() for d in digests]
+    # hashlib only releases the GIL for buffers >=2048 bytes, and pool
+    # dispatch has its own cost, so small batches hash inline
+    if (executor is not None and len(views) > 1
+            and sum(len(v) for v in views) >= 1 << 20):
+        return list(executor.map(lambda v: _chunk_digest(v).hexdigest(), views))
+    return [_chunk_digest(v).hexdigest() for v in views]
+
+def merkle_root(digests: List[bytes]) -> str:
+    """Fold per-chunk digests into one session-level root hash
+
+    Adjacent digests are combined level by level (an odd leaf is promoted
+    unchanged), so a later integrity check can verify any single chunk
+    against the root with O(log N) sibling hashes instead of re-reading
+    the source data. Each level's combines go through the batched hasher.
+    """
+    if not digests:
+        return _chunk_digest(b'').hexdigest()
+    level = digests
+    while len(level) > 1:
+        pairs = [level[i] + level[i + 1] for i in range(0, len(level) - 1, 2)]
+        combined = [bytes.fromhex(h) for h in _sha256_batch(pairs)]
+        if len(level) % 2:
+            combined.append(level[-1])
+        level = combined
+    return level[0].hex()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -40,15 +137,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# slots=True drops the per-instance __dict__, roughly halving the memory
+# held by large chunk lists
+@dataclass(slots=True)
 class ChunkInfo:
-    """Information about a file chunk"""
+    """Information about a file chunk
+
+    Uses __slots__, so subclasses cannot add attributes beyond the
+    declared fields.
+    """
     chunk_id: str
     file_path: str
     chunk_index: int
     total_chunks: int
     size: int
     checksum: str
+    offset: int = 0
     uploaded: bool = False
     upload_time: Optional[float] = None
     retry_count: int = 0
@@ -61,10 +165,91 @@ class UploadSession:
     source_path: str
     total_size: int
     chunks: List[ChunkInfo]
-    start_time: datetime
+    start_time: float  # epoch seconds; a plain float survives save/load as-is
     completed: bool = False
     progress_percentage: float = 0.0
-    
+    root_hash: str = ''
+    version: int = 0  # bumped on chunk-state mutation; keys the status memo
+
+    _uploaded_flag = attrgetter('uploaded')
+
+    def pending(self) -> List[ChunkInfo]:
+        """Chunks still awaiting upload; the filter loop stays in C"""
+        return list(itertools.filterfalse(self._uploaded_flag, self.chunks))
+
+    def uploaded_count(self) -> int:
+        """How many chunks have landed; one C-level pass"""
+        return sum(map(self._uploaded_flag, self.chunks))
+
+class RateLimiter:
+    """Proactive pacing seeded from GitHub's X-RateLimit-* headers
+
+    Every response reports the remaining quota and its reset time;
+    spreading that quota across the window up front avoids ever hitting
+    a 403 or burning an extra API call probing the rate-limit endpoint.
+    A Retry-After header (secondary limits) is honoured verbatim.
+    """
+
+    def __init__(self):
+        self.remaining: Optional[int] = None
+        self.reset: float = 0.0
+        self._lock = asyncio.Lock()
+
+    def observe(self, headers) -> None:
+        """Record quota state from a response's headers"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is not None:
+            self.remaining = int(remaining)
+        reset = headers.get('X-RateLimit-Reset')
+        if reset is not None:
+            self.reset = float(reset)
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            self.remaining = 0
+            self.reset = time.time() + float(retry_after)
+
+    async def acquire(self) -> None:
+        """Wait long enough that the remaining quota spans the window"""
+        async with self._lock:
+            if self.remaining is None:
+                return
+            window = self.reset - time.time()
+            if self.remaining <= 0:
+                delay = max(window, 0.0)
+            else:
+                delay = max(window / self.remaining, 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class BufferPool:
+    """Fixed set of reusable bytearrays that bounds upload heap growth
+
+    Handing the same count buffers back and forth caps peak RSS at
+    count x size no matter how long an upload runs, and spares the
+    allocator a fresh multi-megabyte buffer per chunk.
+    """
+
+    def __init__(self, count: int, size: int):
+        self._size = size
+        self._buffers: 'queue.Queue[bytearray]' = queue.Queue(maxsize=count)
+        for _ in range(count):
+            self._buffers.put(bytearray(size))
+
+    def get(self) -> bytearray:
+        # Never block the event loop: hand out a fresh buffer when the
+        # cache is empty; the caller's in-flight window bounds how many
+        # can exist at once
+        try:
+            return self._buffers.get_nowait()
+        except queue.Empty:
+            return bytearray(self._size)
+
+    def put(self, buf: bytearray):
+        try:
+            self._buffers.put_nowait(buf)
+        except queue.Full:
+            pass  # keep only count buffers cached
+
 class SmartUploadManager:
     """Intelligent upload manager with chunking and optimization"""
     
@@ -76,27 +261,149 @@ class SmartUploadManager:
         'ultra': 25 * 1024 * 1024      # 25MB for ultra-fast connections
     }
     
+    # Branch that receives batched chunk commits
+    UPLOAD_BRANCH = 'uploads'
+
+    # Chunks above this go to LFS as raw bytes instead of base64 blobs
+    LFS_THRESHOLD = 1024 * 1024
+
+    # Hard ceiling applied by adaptive chunking; sizes the buffer pool
+    CHUNK_SIZE_MAX = 50 * 1024 * 1024
+    # Largest encoded payload: base64 expansion plus the JSON envelope
+    ENCODED_BUFFER_SIZE = (CHUNK_SIZE_MAX + 2) // 3 * 4 + 64
+
     # File type optimizations
     COMPRESSIBLE_EXTENSIONS = {'.txt', '.md', '.py', '.js', '.ts', '.html', '.css', '.json', '.xml', '.yml', '.yaml'}
     SKIP_EXTENSIONS = {'.pyc', '.pyo', '.pyd', '.so', '.dylib', '.dll', '.exe'}
     BINARY_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mov', '.avi', '.zip', '.tar', '.gz'}
     
-    def __init__(self, github_token: str, max_retries: int = 3):
+    def __init__(self, github_token: str, max_retries: int = 3, max_concurrent: int = 3):
         """Initialize the upload manager"""
         self.github_token = github_token
         self.github = Github(github_token)
         self.max_retries = max_retries
+        self.max_concurrent = max_concurrent
         self.sessions: Dict[str, UploadSession] = {}
         self.network_speed = 'medium'  # Default, will be auto-detected
         self.executor = ThreadPoolExecutor(max_workers=4)
-        
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lfs_session: Optional[aiohttp.ClientSession] = None
+        self._mmaps: Dict[str, mmap.mmap] = {}
+        self._buffer_pool: Optional[BufferPool] = None
+        self._rate_limiter = RateLimiter()
+        self._status_cache: Dict[str, tuple] = {}
+
+    @staticmethod
+    def _encoded_size(chunk_size: int) -> int:
+        """Bytes needed for a chunk's base64 JSON envelope"""
+        return (chunk_size + 2) // 3 * 4 + 64
+
+    def _chunk_buffers(self, size: int) -> BufferPool:
+        """Payload buffer pool for one staging batch
+
+        Buffers are sized to the batch actually being staged, not the
+        50MB ceiling, so a widened small-chunk window holds megabytes
+        rather than gigabytes of encode space. Rebuilt whenever the
+        batch size profile changes; built on first upload so the analyze
+        and status paths never pay for it.
+        """
+        if self._buffer_pool is None or self._buffer_pool._size != size:
+            self._buffer_pool = BufferPool(self.max_concurrent, size)
+        return self._buffer_pool
+
+    # Most mappings a manager keeps open at once; directory sessions
+    # touch one file after another, so FIFO eviction fits
+    _MMAP_CACHE_MAX = 8
+
+    def _file_view(self, path: str) -> mmap.mmap:
+        """Memory-map a source file once and reuse the mapping per chunk"""
+        mm = self._mmaps.get(path)
+        if mm is None:
+            while len(self._mmaps) >= self._MMAP_CACHE_MAX:
+                old = self._mmaps.pop(next(iter(self._mmaps)))
+                try:
+                    old.close()
+                except BufferError:
+                    pass  # an in-flight view still holds it; closes on release
+            with open(path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                # Chunking sweeps the file front to back; telling the
+                # kernel so keeps readahead running while earlier pages
+                # are still being hashed
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+                mm.madvise(mmap.MADV_WILLNEED)
+            self._mmaps[path] = mm
+        return mm
+
+    async def _http(self) -> aiohttp.ClientSession:
+        """Shared ClientSession so every upload reuses warm connections
+
+        One connector pool sized to max_concurrent keeps TLS handshakes
+        and DNS lookups out of the per-chunk path; keep-alive is aiohttp's
+        default on a persistent session.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrent,
+                                               ttl_dns_cache=300),
+                headers=self._api_headers(),
+            )
+        return self._session
+
+    async def _lfs_http(self) -> aiohttp.ClientSession:
+        """Bare session for presigned LFS storage uploads
+
+        Storage hosts authenticate via the presigned URL plus whatever
+        headers the batch action names; the API session's default
+        Authorization header must never reach them -- S3-style endpoints
+        reject the extra header, and it would hand the GitHub token to a
+        third-party host.
+        """
+        if self._lfs_session is None or self._lfs_session.closed:
+            self._lfs_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrent,
+                                               ttl_dns_cache=300))
+        return self._lfs_session
+
+    async def close(self):
+        """Release the shared HTTP sessions and any file mappings"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._lfs_session is not None and not self._lfs_session.closed:
+            await self._lfs_session.close()
+        self._lfs_session = None
+        for mm in self._mmaps.values():
+            mm.close()
+        self._mmaps.clear()
+
+    async def __aenter__(self) -> 'SmartUploadManager':
+        await self._http()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @staticmethod
+    def _classify_speed(speed_mbps: float) -> str:
+        """Map a measured MB/s figure onto a chunk-size tier"""
+        if speed_mbps < 1:
+            return 'slow'
+        elif speed_mbps < 5:
+            return 'medium'
+        elif speed_mbps < 20:
+            return 'fast'
+        else:
+            return 'ultra'
+
     def analyze_network_speed(self) -> str:
         """Detect network speed for optimal chunk sizing"""
         try:
             # Test upload speed with a small file
             test_size = 1024 * 100  # 100KB test
             test_data = os.urandom(test_size)
-            
+
             start_time = time.time()
             response = requests.post(
                 'https://httpbin.org/post',
@@ -104,23 +411,80 @@ class SmartUploadManager:
                 timeout=10
             )
             elapsed = time.time() - start_time
-            
+
             # Calculate speed in MB/s
             speed_mbps = (test_size / elapsed) / (1024 * 1024)
-            
-            if speed_mbps < 1:
-                return 'slow'
-            elif speed_mbps < 5:
-                return 'medium'
-            elif speed_mbps < 20:
-                return 'fast'
-            else:
-                return 'ultra'
-                
+            return self._classify_speed(speed_mbps)
+
+        except Exception as e:
+            logger.warning(f"Network speed detection failed: {e}, using medium")
+            return 'medium'
+
+    async def analyze_network_speed_async(self, repo_name: Optional[str] = None) -> str:
+        """Classify upload bandwidth over a warmed connection
+
+        The old probe paid a fresh TLS handshake inside its timing
+        window, so fast links were systematically classified a tier too
+        low. Here the first transfer only warms the shared session's
+        pool; the next three are timed and the median taken, so the
+        ultra tier can actually be reached. With a repo name the probes
+        go to its blob endpoint (unreferenced blobs are garbage-collected
+        server-side); otherwise the public echo endpoint is used.
+        """
+        probe_size = 256 * 1024
+        payload = os.urandom(probe_size)
+        if repo_name:
+            url = f"{GITHUB_API_URL}/repos/{repo_name}/git/blobs"
+            body = {'content': base64.b64encode(payload).decode('ascii'),
+                    'encoding': 'base64'}
+        else:
+            url = 'https://httpbin.org/post'
+            body = None
+
+        try:
+            http = await self._http()
+            timings = []
+            for i in range(4):
+                start = time.perf_counter()
+                if body is not None:
+                    async with http.post(url, json=body) as resp:
+                        await resp.read()
+                else:
+                    async with http.post(url, data=payload) as resp:
+                        await resp.read()
+                if i:  # first round trip warms the connection
+                    timings.append(time.perf_counter() - start)
+            timings.sort()
+            median = timings[len(timings) // 2]
+            speed_mbps = (probe_size / median) / (1024 * 1024)
+            return self._classify_speed(speed_mbps)
+
         except Exception as e:
             logger.warning(f"Network speed detection failed: {e}, using medium")
             return 'medium'
     
+    @staticmethod
+    def _walk_entries(path):
+        """Yield file DirEntries recursively
+
+        os.scandir hands back name, type and stat data from the getdents
+        batch the kernel already returned, so the walk costs one syscall
+        per directory instead of one per file.
+        """
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            return
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from SmartUploadManager._walk_entries(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+                except OSError:
+                    continue
+
     def analyze_repository(self, repo_path: str) -> Dict[str, Any]:
         """Analyze repository for optimization opportunities"""
         stats = {
@@ -130,6 +494,7 @@ class SmartUploadManager:
             'binary_size': 0,
             'skip_files': [],
             'large_files': [],
+            'file_sizes': {},
             'git_objects_size': 0,
             'recommendations': []
         }
@@ -142,38 +507,43 @@ class SmartUploadManager:
             git_dir = repo_path / '.git'
             if git_dir.exists():
                 stats['git_objects_size'] = sum(
-                    f.stat().st_size for f in git_dir.rglob('*') if f.is_file()
+                    e.stat(follow_symlinks=False).st_size
+                    for e in self._walk_entries(git_dir)
                 )
         except:
             pass
-        
-        # Analyze files
-        for file_path in repo_path.rglob('*'):
-            if file_path.is_file():
-                try:
-                    size = file_path.stat().st_size
-                    stats['total_files'] += 1
-                    stats['total_size'] += size
-                    
-                    # Check file type
-                    ext = file_path.suffix.lower()
-                    
-                    if ext in self.SKIP_EXTENSIONS:
-                        stats['skip_files'].append(str(file_path))
-                    elif ext in self.COMPRESSIBLE_EXTENSIONS:
-                        stats['compressible_size'] += size
-                    elif ext in self.BINARY_EXTENSIONS:
-                        stats['binary_size'] += size
-                    
-                    # Track large files
-                    if size > 50 * 1024 * 1024:  # Files larger than 50MB
-                        stats['large_files'].append({
-                            'path': str(file_path),
-                            'size': size
-                        })
-                        
-                except Exception as e:
-                    logger.warning(f"Error analyzing {file_path}: {e}")
+
+        # Analyze files; DirEntry.stat reuses the data scandir already
+        # fetched, and extensions come off the raw name so no Path objects
+        # are built in the loop
+        for entry in self._walk_entries(repo_path):
+            try:
+                size = entry.stat(follow_symlinks=False).st_size
+                stats['total_files'] += 1
+                stats['total_size'] += size
+                stats['file_sizes'][entry.path] = size
+
+                # Check file type
+                name = entry.name
+                dot = name.rfind('.')
+                ext = name[dot:].lower() if dot > 0 else ''
+
+                if ext in self.SKIP_EXTENSIONS:
+                    stats['skip_files'].append(entry.path)
+                elif ext in self.COMPRESSIBLE_EXTENSIONS:
+                    stats['compressible_size'] += size
+                elif ext in self.BINARY_EXTENSIONS:
+                    stats['binary_size'] += size
+
+                # Track large files
+                if size > 50 * 1024 * 1024:  # Files larger than 50MB
+                    stats['large_files'].append({
+                        'path': entry.path,
+                        'size': size
+                    })
+
+            except Exception as e:
+                logger.warning(f"Error analyzing {entry.path}: {e}")
         
         # Generate recommendations
         if stats['git_objects_size'] > stats['total_size'] * 0.5:
@@ -197,27 +567,43 @@ class SmartUploadManager:
         
         # Adaptive chunking for large files
         if file_size > 100 * 1024 * 1024:  # Files > 100MB
-            chunk_size = min(chunk_size * 2, 50 * 1024 * 1024)  # Max 50MB chunks
+            chunk_size = min(chunk_size * 2, self.CHUNK_SIZE_MAX)
         
-        chunks = []
         num_chunks = (file_size + chunk_size - 1) // chunk_size
-        
-        with open(file_path, 'rb') as f:
-            for i in range(num_chunks):
-                chunk_data = f.read(chunk_size)
-                chunk_checksum = hashlib.sha256(chunk_data).hexdigest()
-                
-                chunk_info = ChunkInfo(
-                    chunk_id=f"{session_id}_{file_path.name}_{i}",
-                    file_path=str(file_path),
-                    chunk_index=i,
-                    total_chunks=num_chunks,
-                    size=len(chunk_data),
-                    checksum=chunk_checksum
-                )
-                chunks.append(chunk_info)
-        
-        return chunks
+        if num_chunks == 0:
+            return []
+
+        # hashlib releases the GIL for large buffers, so the thread pool
+        # hashes chunks on every core; slicing the shared mapping avoids a
+        # read() copy per chunk
+        mm = self._file_view(str(file_path))
+        mv = memoryview(mm)
+        # Only the final chunk can be short, so the span table is a plain
+        # arithmetic progression plus one tail entry — no per-chunk min()
+        spans = [(i * chunk_size, chunk_size) for i in range(num_chunks - 1)]
+        tail_offset = (num_chunks - 1) * chunk_size
+        spans.append((tail_offset, file_size - tail_offset))
+        digests = _sha256_batch(
+            [mv[offset:offset + size] for offset, size in spans],
+            self.executor)
+
+        # Everything invariant across the loop is computed once; only the
+        # index varies per chunk, which matters when a desktop backup
+        # builds hundreds of thousands of these
+        id_prefix = f"{session_id}_{file_path.name}_"
+        path_str = str(file_path)
+        return [
+            ChunkInfo(
+                chunk_id=id_prefix + str(i),
+                file_path=path_str,
+                chunk_index=i,
+                total_chunks=num_chunks,
+                size=size,
+                checksum=checksum,
+                offset=offset
+            )
+            for i, ((offset, size), checksum) in enumerate(zip(spans, digests))
+        ]
     
     def compress_directory(self, source_path: str, output_path: str, 
                           exclude_patterns: List[str] = None) -> str:
@@ -234,101 +620,308 @@ class SmartUploadManager:
         ]
         
         exclude_patterns = (exclude_patterns or []) + default_exclude
-        
-        # Create tar.gz with compression
-        archive_path = output_path / f"{source_path.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.tar.gz"
-        
-        with tarfile.open(archive_path, 'w:gz') as tar:
+
+        # One compiled alternation checks every pattern in a single pass
+        # per path instead of P fnmatch calls
+        exclude_re = re.compile('|'.join(
+            f"(?:{fnmatch.translate(p)})" for p in exclude_patterns))
+
+        def add_files(tar):
             for item in source_path.rglob('*'):
-                # Check exclusions
-                should_exclude = False
-                for pattern in exclude_patterns:
-                    if item.match(pattern):
-                        should_exclude = True
-                        break
-                
-                if not should_exclude and item.is_file():
+                if item.is_file() and not exclude_re.search(str(item)):
                     arcname = item.relative_to(source_path.parent)
                     tar.add(item, arcname=arcname)
-                    
-        return str(archive_path)
+
+        archive_base = output_path / f"{source_path.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        # Stream an uncompressed tar into a multi-threaded compressor so
+        # DEFLATE/zstd runs on every core instead of serializing in-process
+        if shutil.which('zstd'):
+            compressor, suffix = ['zstd', '-T0', '-19', '--long=27', '-q', '-c'], '.tar.zst'
+        elif shutil.which('pigz'):
+            compressor, suffix = ['pigz', '-c'], '.tar.gz'
+        else:
+            compressor, suffix = None, '.tar.gz'
+
+        archive_path = str(archive_base) + suffix
+
+        if compressor is not None:
+            with open(archive_path, 'wb') as out:
+                proc = subprocess.Popen(compressor, stdin=subprocess.PIPE, stdout=out)
+                try:
+                    with tarfile.open(fileobj=proc.stdin, mode='w|') as tar:
+                        add_files(tar)
+                finally:
+                    proc.stdin.close()
+                if proc.wait() != 0:
+                    raise RuntimeError(f"{compressor[0]} exited with {proc.returncode}")
+        else:
+            # Single-core in-process fallback when neither tool is installed
+            with tarfile.open(archive_path, 'w:gz') as tar:
+                add_files(tar)
+
+        return archive_path
     
-    async def upload_chunk_to_github(self, chunk: ChunkInfo, repo_name: str) -> bool:
-        """Upload a single chunk to GitHub with retry logic"""
+    def _api_headers(self) -> Dict[str, str]:
+        """Headers for direct GitHub REST calls"""
+        return {
+            'Authorization': f'token {self.github_token}',
+            'Accept': 'application/vnd.github+json',
+        }
+
+    def _encode_chunk_body(self, view: memoryview, buf: bytearray) -> int:
+        """Assemble the blob JSON envelope inside a pooled buffer
+
+        The chunk is base64-encoded in 192KB steps (a multiple of 3, so no
+        padding appears mid-stream); only those small slices are transient
+        allocations, and the full payload lands in the reusable buffer.
+        Returns the payload length.
+        """
+        prefix = b'{"encoding":"base64","content":"'
+        n = len(prefix)
+        buf[:n] = prefix
+        step = 192 * 1024
+        for off in range(0, len(view), step):
+            piece = binascii.b2a_base64(view[off:off + step], newline=False)
+            buf[n:n + len(piece)] = piece
+            n += len(piece)
+        buf[n:n + 2] = b'"}'
+        return n + 2
+
+    async def _upload_blob(self, http: aiohttp.ClientSession, api_base: str,
+                           chunk: ChunkInfo, pool: BufferPool) -> Optional[str]:
+        """Stage one chunk as a git blob with retry, returning its sha"""
+        buf = pool.get()
+        try:
+            return await self._upload_blob_buffered(http, api_base, chunk, buf)
+        finally:
+            pool.put(buf)
+
+    async def _upload_chunk_lfs(self, http: aiohttp.ClientSession, api_base: str,
+                                chunk: ChunkInfo, view: memoryview) -> Optional[str]:
+        """Send one chunk as raw bytes via LFS, returning a pointer blob sha
+
+        The LFS batch endpoint hands back a presigned upload URL, the
+        chunk goes up as application/octet-stream straight from the file
+        mapping (no base64, 25% fewer bytes on the wire), and a tiny
+        pointer blob takes the chunk's place in the batched tree commit.
+        The chunk's existing SHA-256 checksum doubles as the LFS oid.
+        Returns None so the caller can fall back to the base64 blob path.
+        """
+        repo_name = api_base.rsplit('/repos/', 1)[1]
+        # LFS-over-HTTPS authenticates with Basic (user:PAT), not the
+        # REST API's token scheme; the per-request header overrides the
+        # shared session's default
+        basic = base64.b64encode(f"git:{self.github_token}".encode()).decode()
+        lfs_headers = {'Accept': 'application/vnd.git-lfs+json',
+                       'Content-Type': 'application/vnd.git-lfs+json',
+                       'Authorization': f'Basic {basic}'}
+        # LFS oids are SHA-256 by spec; recompute when the configured
+        # chunk digest is something else
+        oid = (chunk.checksum if _CHUNK_HASH == 'sha256'
+               else _sha256(view).hexdigest())
+        payload = {
+            'operation': 'upload',
+            'transfers': ['basic'],
+            'objects': [{'oid': oid, 'size': chunk.size}],
+        }
+
+        async with http.post(f"https://github.com/{repo_name}.git/info/lfs/objects/batch",
+                             json=payload, headers=lfs_headers) as resp:
+            if resp.status != 200:
+                return None
+            obj = (await resp.json())['objects'][0]
+
+        # No upload action means the server already has this object
+        action = obj.get('actions', {}).get('upload')
+        if action is not None:
+            # The presigned PUT goes through the bare session so the only
+            # headers on the wire are octet-stream plus exactly what the
+            # action supplies -- never the API Authorization default
+            put_headers = {'Content-Type': 'application/octet-stream'}
+            put_headers.update(action.get('header', {}))
+            storage = await self._lfs_http()
+            async with storage.put(action['href'], data=view, headers=put_headers) as resp:
+                if resp.status not in (200, 201):
+                    logger.error(f"LFS upload failed for {chunk.chunk_id}: HTTP {resp.status}")
+                    return None
+
+        pointer = (f"version https://git-lfs.github.com/spec/v1\n"
+                   f"oid sha256:{oid}\n"
+                   f"size {chunk.size}\n")
+        await self._rate_limiter.acquire()
+        async with http.post(f"{api_base}/git/blobs",
+                             json={'content': pointer, 'encoding': 'utf-8'}) as resp:
+            self._rate_limiter.observe(resp.headers)
+            if resp.status == 201:
+                return (await resp.json())['sha']
+        return None
+
+    async def _upload_blob_buffered(self, http: aiohttp.ClientSession, api_base: str,
+                                    chunk: ChunkInfo, buf: bytearray) -> Optional[str]:
         for attempt in range(self.max_retries):
             try:
-                repo = self.github.get_repo(repo_name)
-                
-                # Read chunk data
-                with open(chunk.file_path, 'rb') as f:
-                    f.seek(chunk.chunk_index * self.CHUNK_SIZES[self.network_speed])
-                    chunk_data = f.read(chunk.size)
-                
-                # Encode for GitHub
-                content = base64.b64encode(chunk_data).decode('utf-8')
-                
-                # Create unique path for chunk
-                chunk_path = f".uploads/{chunk.chunk_id}"
-                
-                # Upload to GitHub
-                repo.create_file(
-                    path=chunk_path,
-                    message=f"Upload chunk {chunk.chunk_index + 1}/{chunk.total_chunks}",
-                    content=content,
-                    branch="uploads"
-                )
-                
-                chunk.uploaded = True
-                chunk.upload_time = time.time()
-                logger.info(f"Successfully uploaded chunk {chunk.chunk_id}")
-                return True
-                
-            except RateLimitExceededException:
-                # Handle rate limiting
-                reset_time = self.github.get_rate_limit().core.reset
-                wait_time = (reset_time - datetime.utcnow()).total_seconds()
-                logger.warning(f"Rate limited, waiting {wait_time} seconds")
-                await asyncio.sleep(wait_time)
-                
+                # Chunk bytes come straight from the shared file mapping;
+                # base64 is the only copy, and the JSON envelope stays bytes
+                # so the payload is never widened into a str
+                mm = self._file_view(chunk.file_path)
+                view = memoryview(mm)[chunk.offset:chunk.offset + chunk.size]
+
+                if chunk.size > self.LFS_THRESHOLD:
+                    sha = await self._upload_chunk_lfs(http, api_base, chunk, view)
+                    if sha is not None:
+                        logger.info(f"Staged chunk {chunk.chunk_id} via LFS")
+                        return sha
+                    # LFS unavailable for this repo; base64 blob below
+                body = memoryview(buf)[:self._encode_chunk_body(view, buf)]
+
+                await self._rate_limiter.acquire()
+                async with http.post(f"{api_base}/git/blobs", data=body,
+                                     headers={'Content-Type': 'application/json'}) as resp:
+                    self._rate_limiter.observe(resp.headers)
+                    if resp.status == 201:
+                        body = await resp.json()
+                        logger.info(f"Staged blob for chunk {chunk.chunk_id}")
+                        return body['sha']
+
+                    if (resp.status == 403 and
+                            resp.headers.get('X-RateLimit-Remaining') == '0'):
+                        reset = int(resp.headers.get('X-RateLimit-Reset', '0'))
+                        wait_time = max(reset - time.time(), 1.0)
+                        logger.warning(f"Rate limited, waiting {wait_time:.0f} seconds")
+                        await asyncio.sleep(wait_time)
+                        continue
+
+                    logger.error(f"Blob upload failed for {chunk.chunk_id}: HTTP {resp.status}")
+
             except Exception as e:
                 logger.error(f"Error uploading chunk {chunk.chunk_id}: {e}")
-                chunk.retry_count += 1
-                
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                    
-        return False
-    
-    async def parallel_upload(self, session: UploadSession, max_concurrent: int = 3):
-        """Upload chunks in parallel with rate limiting"""
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def upload_with_semaphore(chunk):
+
+            chunk.retry_count += 1
+            if attempt < self.max_retries - 1:
+                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+
+        return None
+
+    async def upload_blob_batch(self, http: aiohttp.ClientSession, api_base: str,
+                                chunks: List[ChunkInfo], max_concurrent: int = 3,
+                                progress: Optional[Any] = None) -> List[Tuple[ChunkInfo, str]]:
+        """Stage chunk contents as git blobs, many in flight at once
+
+        Blobs are cheap server-side objects: nothing appears in the
+        repository until _commit_chunk_batch ties them into a single tree
+        and commit, so staging can run at full concurrency without
+        producing one commit per chunk.
+        """
+        if not chunks:
+            return []
+
+        semaphore = asyncio.Semaphore(self._batch_window(chunks, max_concurrent))
+        pool = self._chunk_buffers(
+            max(self._encoded_size(c.size) for c in chunks))
+
+        async def stage(chunk):
             async with semaphore:
-                return await self.upload_chunk_to_github(chunk, session.repo_name)
-        
-        # Filter chunks that need uploading
-        pending_chunks = [c for c in session.chunks if not c.uploaded]
-        
-        # Create progress bar
-        with tqdm(total=len(pending_chunks), desc="Uploading chunks") as pbar:
-            tasks = []
-            for chunk in pending_chunks:
-                task = asyncio.create_task(upload_with_semaphore(chunk))
-                tasks.append((chunk, task))
-            
-            for chunk, task in tasks:
-                success = await task
-                if success:
-                    pbar.update(1)
-                    
-                # Update session progress
-                uploaded_count = sum(1 for c in session.chunks if c.uploaded)
-                session.progress_percentage = (uploaded_count / len(session.chunks)) * 100
-    
+                sha = await self._upload_blob(http, api_base, chunk, pool)
+            if sha and progress is not None:
+                progress.update(1)
+            return chunk, sha
+
+        staged = await asyncio.gather(*(stage(c) for c in chunks))
+        return [(chunk, sha) for chunk, sha in staged if sha]
+
+    def _batch_window(self, chunks: List[ChunkInfo], base: int) -> int:
+        """Adaptive in-flight window for a staging batch
+
+        Per-request overhead dominates on the 1MB slow tier, so batches
+        of small chunks widen the window (clamped to 4..64) to keep the
+        warm connections saturated and overlap encoding with transfers.
+        Medium-and-larger chunks stay at the configured concurrency, and
+        the widened window is additionally clamped so in-flight encode
+        buffers never exceed what the base window would hold at the
+        50MB ceiling -- a small-chunk batch with one large outlier
+        cannot balloon the heap.
+        """
+        avg_size = sum(c.size for c in chunks) // len(chunks)
+        if avg_size >= self.CHUNK_SIZES['medium']:
+            return base
+        budget = base * self.ENCODED_BUFFER_SIZE
+        per_buffer = self._encoded_size(max(c.size for c in chunks))
+        window = min(64, max(4, len(chunks) // max(base, 1)),
+                     budget // per_buffer)
+        return max(base, window)
+
+    async def _commit_chunk_batch(self, http: aiohttp.ClientSession, api_base: str,
+                                  staged: List[Tuple[ChunkInfo, str]]):
+        """Tie staged blobs into one tree, one commit and one ref update"""
+        ref_url = f"{api_base}/git/refs/heads/{self.UPLOAD_BRANCH}"
+
+        async with http.get(ref_url) as resp:
+            resp.raise_for_status()
+            parent_sha = (await resp.json())['object']['sha']
+
+        async with http.get(f"{api_base}/git/commits/{parent_sha}") as resp:
+            resp.raise_for_status()
+            base_tree = (await resp.json())['tree']['sha']
+
+        tree_entries = [
+            {'path': f".uploads/{chunk.chunk_id}", 'mode': '100644',
+             'type': 'blob', 'sha': sha}
+            for chunk, sha in staged
+        ]
+
+        async with http.post(f"{api_base}/git/trees",
+                             json={'base_tree': base_tree, 'tree': tree_entries}) as resp:
+            resp.raise_for_status()
+            tree_sha = (await resp.json())['sha']
+
+        async with http.post(f"{api_base}/git/commits",
+                             json={'message': f"Upload {len(staged)} chunks",
+                                   'tree': tree_sha,
+                                   'parents': [parent_sha]}) as resp:
+            resp.raise_for_status()
+            commit_sha = (await resp.json())['sha']
+
+        async with http.patch(ref_url, json={'sha': commit_sha}) as resp:
+            resp.raise_for_status()
+
+        logger.info(f"Committed {len(staged)} chunks in one batch ({commit_sha[:8]})")
+
+    async def parallel_upload(self, session: UploadSession, max_concurrent: Optional[int] = None):
+        """Upload all pending chunks as a single batched commit"""
+        pending_chunks = session.pending()
+        total = len(session.chunks)
+        if not pending_chunks:
+            session.progress_percentage = 100.0
+            return
+
+        # Running counter established once; completions only add to it,
+        # so progress never rescans the chunk list
+        uploaded_count = total - len(pending_chunks)
+
+        api_base = f"{GITHUB_API_URL}/repos/{session.repo_name}"
+        http = await self._http()
+
+        with tqdm(total=len(pending_chunks), desc="Staging chunks",
+                  mininterval=0.5) as pbar:
+            staged = await self.upload_blob_batch(
+                http, api_base, pending_chunks,
+                max_concurrent or self.max_concurrent, pbar)
+
+        if staged:
+            await self._commit_chunk_batch(http, api_base, staged)
+            now = time.time()
+            for chunk, _ in staged:
+                chunk.uploaded = True
+                chunk.upload_time = now
+            uploaded_count += len(staged)
+            session.version += 1
+
+        session.progress_percentage = uploaded_count * 100 / total
+
     def create_upload_session(self, source_path: str, repo_name: str) -> UploadSession:
         """Create a new upload session"""
-        session_id = hashlib.sha256(f"{source_path}_{datetime.now()}".encode()).hexdigest()[:16]
+        session_id = _sha256(f"{source_path}_{datetime.now()}".encode()).hexdigest()[:16]
         
         # Analyze source
         if Path(source_path).is_dir():
@@ -346,10 +939,10 @@ class SmartUploadManager:
         if Path(source_path).is_file():
             chunks = self.create_smart_chunks(source_path, session_id)
         else:
-            # Create chunks for all files in directory
-            for file_path in Path(source_path).rglob('*'):
-                if file_path.is_file():
-                    chunks.extend(self.create_smart_chunks(str(file_path), session_id))
+            # Create chunks for all files in directory; same batched
+            # scandir walk as analyze_repository
+            for entry in self._walk_entries(source_path):
+                chunks.extend(self.create_smart_chunks(entry.path, session_id))
         
         session = UploadSession(
             session_id=session_id,
@@ -357,7 +950,8 @@ class SmartUploadManager:
             source_path=source_path,
             total_size=sum(c.size for c in chunks),
             chunks=chunks,
-            start_time=datetime.now()
+            start_time=time.time(),
+            root_hash=merkle_root([bytes.fromhex(c.checksum) for c in chunks])
         )
         
         self.sessions[session_id] = session
@@ -371,25 +965,42 @@ class SmartUploadManager:
         """Save session state for recovery"""
         session_file = Path(f".upload_sessions/{session.session_id}.json")
         session_file.parent.mkdir(exist_ok=True)
-        
-        with open(session_file, 'w') as f:
-            # Convert to dict for JSON serialization
-            session_dict = asdict(session)
-            session_dict['start_time'] = session.start_time.isoformat()
-            json.dump(session_dict, f, indent=2)
+
+        # A shallow __dict__ copy skips asdict's recursive walk over the
+        # session; chunks are slotted so they go through asdict, and the
+        # encoded payload goes out in a single write
+        session_dict = dict(session.__dict__)
+        session_dict['chunks'] = [asdict(c) for c in session.chunks]
+
+        # Canonical .json first, sidecar second, so a fresh .msgpack is
+        # never older than the .json it mirrors
+        session_file.write_bytes(_dumps(session_dict))
+        if _SESSION_MSGPACK:
+            session_file.with_suffix('.msgpack').write_bytes(
+                msgpack.packb(session_dict, use_bin_type=True))
     
     def load_session(self, session_id: str) -> Optional[UploadSession]:
         """Load a previous session for resuming"""
         session_file = Path(f".upload_sessions/{session_id}.json")
-        
-        if not session_file.exists():
+        msgpack_file = session_file.with_suffix('.msgpack')
+
+        # The sidecar only shadows the canonical .json while it is at
+        # least as fresh: saves made without SESSION_MSGPACK refresh the
+        # .json alone, and a stale .msgpack must not win over it
+        use_msgpack = (msgpack is not None and msgpack_file.exists()
+                       and (not session_file.exists()
+                            or msgpack_file.stat().st_mtime
+                            >= session_file.stat().st_mtime))
+
+        if use_msgpack:
+            session_dict = msgpack.unpackb(msgpack_file.read_bytes(), raw=False)
+        elif session_file.exists():
+            with open(session_file, 'r') as f:
+                session_dict = json.load(f)
+        else:
             return None
-        
-        with open(session_file, 'r') as f:
-            session_dict = json.load(f)
             
         # Convert back to UploadSession
-        session_dict['start_time'] = datetime.fromisoformat(session_dict['start_time'])
         session_dict['chunks'] = [ChunkInfo(**c) for c in session_dict['chunks']]
         
         return UploadSession(**session_dict)
@@ -406,14 +1017,14 @@ class SmartUploadManager:
         logger.info(f"Progress: {session.progress_percentage:.1f}% complete")
         
         # Re-detect network speed
-        self.network_speed = self.analyze_network_speed()
+        self.network_speed = await self.analyze_network_speed_async(session.repo_name)
         logger.info(f"Network speed: {self.network_speed}")
         
         # Continue upload
         await self.parallel_upload(session)
         
         # Check if complete
-        if all(c.uploaded for c in session.chunks):
+        if not session.pending():
             session.completed = True
             logger.info(f"Upload session {session_id} completed successfully!")
             return True
@@ -426,13 +1037,22 @@ class SmartUploadManager:
         
         if not session:
             return {'error': 'Session not found'}
-        
-        uploaded_chunks = sum(1 for c in session.chunks if c.uploaded)
-        failed_chunks = sum(1 for c in session.chunks if c.retry_count >= self.max_retries)
-        
-        elapsed_time = (datetime.now() - session.start_time).total_seconds()
-        uploaded_size = sum(c.size for c in session.chunks if c.uploaded)
-        
+
+        # The O(N-chunks) aggregates are memoized against session.version,
+        # which mutators bump; repeated status polls between mutations skip
+        # the chunk-list traversal. Time-derived fields stay fresh below.
+        cached = self._status_cache.get(session_id)
+        if cached is not None and cached[0] == session.version:
+            _, uploaded_chunks, failed_chunks, uploaded_size = cached
+        else:
+            uploaded_chunks = session.uploaded_count()
+            failed_chunks = sum(1 for c in session.chunks if c.retry_count >= self.max_retries)
+            uploaded_size = sum(c.size for c in session.chunks if c.uploaded)
+            self._status_cache[session_id] = (
+                session.version, uploaded_chunks, failed_chunks, uploaded_size)
+
+        elapsed_time = time.time() - session.start_time
+
         # Calculate ETA
         if uploaded_size > 0 and elapsed_time > 0:
             upload_speed = uploaded_size / elapsed_time
@@ -482,7 +1102,8 @@ class GitHubBackupOrchestrator:
             )
         
         # Detect network speed
-        self.upload_manager.network_speed = self.upload_manager.analyze_network_speed()
+        self.upload_manager.network_speed = \
+            await self.upload_manager.analyze_network_speed_async(repo.full_name)
         logger.info(f"Detected network speed: {self.upload_manager.network_speed}")
         
         # Create upload session
@@ -580,7 +1201,7 @@ async def main():
         
         # Detect network speed
         print("🌐 Testing network speed...")
-        manager.network_speed = manager.analyze_network_speed()
+        manager.network_speed = await manager.analyze_network_speed_async(args.repo)
         print(f"Network speed: {manager.network_speed}")
         
         # Create session
@@ -632,6 +1253,9 @@ async def main():
         session_id = await orchestrator.backup_desktop_to_github(args.source)
         print(f"✅ Desktop backup started with session ID: {session_id}")
 
+    await manager.close()
+    await orchestrator.upload_manager.close()
+
 if __name__ == "__main__":
     print("""
 ╔══════════════════════════════════════════════════════════╗
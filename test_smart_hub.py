@@ -9,47 +9,135 @@ import sys
 import json
 import time
 import hashlib
+import logging
+import mmap
+import pickle
+import atexit
 import tempfile
+import threading
 import unittest
 import asyncio
+import itertools
 from pathlib import Path
+from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import shutil
 import random
 import string
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# pytest with the xdist plugin shards the TestCase classes across worker
+# processes; neither is a hard dependency, so the runner probes for them
+# and falls back to the serial unittest path
+try:
+    import pytest
+    import xdist  # noqa: F401 -- probed only so -n auto is known to work
+    _HAS_XDIST = True
+except ImportError:
+    pytest = None
+    _HAS_XDIST = False
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 # Import our modules
+import smart_upload_manager
 from smart_upload_manager import (
-    SmartUploadManager, ChunkInfo, UploadSession, 
-    GitHubBackupOrchestrator
+    SmartUploadManager, ChunkInfo, UploadSession,
+    GitHubBackupOrchestrator, RateLimiter
 )
 
+# Phase chatter goes through logging so large runs don't pay a flushed
+# stdout write per step; HUB_TEST_LOG=INFO (or DEBUG) brings it back
+log = logging.getLogger(__name__)
+
+# Fixture payloads built once at import; write_bytes then skips the
+# per-test str multiplication and UTF-8 encode
+_PY_BLOB = b"print('hello')" * 1000
+_JSON_BLOB = b'{"test": "data"}' * 500
+_MODULE_BLOB = b"def function():\n    pass\n" * 100
+_README_BLOB = b"# Documentation\n" * 500
+_CSV_BLOB = b"col1,col2,col3\n" + b"1,2,3\n" * 10000
+
+def shared_manager() -> SmartUploadManager:
+    """Build a manager for a test class to share
+
+    Construction spins up a PyGithub client and a thread pool, so each
+    class makes one in setUpClass and tests reset it via reset_manager.
+    Tests that truly need a pristine instance can call this directly.
+    """
+    return SmartUploadManager("fake_token")
+
+def reset_manager(manager: SmartUploadManager):
+    """Put a shared manager back into its post-construction state"""
+    manager.sessions.clear()
+    manager.network_speed = 'medium'
+
+def _file_sha256(path) -> str:
+    """Reference SHA-256 of a whole file
+
+    hashlib.file_digest (3.11+) hashes through a zero-copy readinto
+    loop straight into OpenSSL; older interpreters fall back to a
+    chunked read so no fixture is ever slurped into one bytes object.
+    """
+    with open(path, 'rb') as f:
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        while block := f.read(1024 * 1024):
+            digest.update(block)
+        return digest.hexdigest()
+
 class TestChunkingAlgorithm(unittest.TestCase):
     """Test the intelligent chunking system"""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the expensive shared fixtures once for the class
+
+        The medium and large files are re-chunked by several tests but
+        never written to, so one sparse copy each serves the whole class.
+        """
+        cls.class_dir = tempfile.mkdtemp()
+        cls.medium_file = Path(cls.class_dir) / "medium.bin"
+        with open(cls.medium_file, 'wb') as f:
+            f.truncate(15 * 1024 * 1024)
+        cls.large_file = Path(cls.class_dir) / "large.bin"
+        with open(cls.large_file, 'wb') as f:
+            f.truncate(150 * 1024 * 1024)
+        cls.manager = shared_manager()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.class_dir, ignore_errors=True)
+
     def setUp(self):
         """Set up test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.manager = SmartUploadManager("fake_token")
-        
+        self.temp_dir = tempfile.mkdtemp(dir=self.class_dir)
+        reset_manager(self.manager)
+
     def tearDown(self):
         """Clean up test environment"""
         shutil.rmtree(self.temp_dir, ignore_errors=True)
-        
-    def create_test_file(self, size_mb: int, name: str = "test.bin") -> Path:
-        """Create a test file of specified size"""
+
+    def create_test_file(self, size_mb: float, name: str = "test.bin") -> Path:
+        """Create a sparse test file of specified size
+
+        The chunker only cares about offsets and lengths, so a truncate
+        is enough — no CSPRNG draw, no data blocks written. Tests that
+        need meaningful content (checksum integrity) build their own
+        deterministic files.
+        """
         file_path = Path(self.temp_dir) / name
-        
-        # Create file with random data
+
         with open(file_path, 'wb') as f:
-            # Write in chunks to avoid memory issues
-            chunk_size = 1024 * 1024  # 1MB chunks
-            for _ in range(size_mb):
-                f.write(os.urandom(chunk_size))
-                
+            f.truncate(int(size_mb * 1024 * 1024))
+
         return file_path
     
     def test_small_file_single_chunk(self):
@@ -74,32 +162,35 @@ class TestChunkingAlgorithm(unittest.TestCase):
         """Test medium files create appropriate chunks"""
         print("\n🧪 Testing medium file chunking...")
         
-        # Create 15MB file
-        file_path = self.create_test_file(15, "medium.bin")
-        
-        # Test with different network speeds
+        # 15MB shared fixture
+        file_path = self.medium_file
+
+        # Expected counts for every tier come from one ceil-division pass
+        # over the size table instead of a hand-maintained constant dict
+        file_size = file_path.stat().st_size
         speeds = ['slow', 'medium', 'fast', 'ultra']
         expected_chunks = {
-            'slow': 15,    # 1MB chunks
-            'medium': 3,   # 5MB chunks
-            'fast': 2,     # 10MB chunks
-            'ultra': 1     # 25MB chunks
+            speed: -(-file_size // size)
+            for speed, size in self.manager.CHUNK_SIZES.items()
         }
-        
+
         for speed in speeds:
-            self.manager.network_speed = speed
-            chunks = self.manager.create_smart_chunks(str(file_path), f"session_{speed}")
-            
-            self.assertEqual(len(chunks), expected_chunks[speed])
-            print(f"✅ 15MB file with {speed} network -> {len(chunks)} chunks")
+            # subTest keeps the four tiers independent: a failure on one
+            # speed is reported per-case instead of masking the rest
+            with self.subTest(speed=speed):
+                self.manager.network_speed = speed
+                chunks = self.manager.create_smart_chunks(str(file_path), f"session_{speed}")
+
+                self.assertEqual(len(chunks), expected_chunks[speed])
+                print(f"✅ 15MB file with {speed} network -> {len(chunks)} chunks")
             
     def test_large_file_adaptive_chunking(self):
         """Test that large files use adaptive chunking"""
         print("\n🧪 Testing large file adaptive chunking...")
         
-        # Create 150MB file
-        file_path = self.create_test_file(150, "large.bin")
-        
+        # 150MB shared fixture
+        file_path = self.large_file
+
         self.manager.network_speed = 'fast'
         chunks = self.manager.create_smart_chunks(str(file_path), "large_session")
         
@@ -120,44 +211,60 @@ class TestChunkingAlgorithm(unittest.TestCase):
         self.manager.network_speed = 'slow'
         chunks = self.manager.create_smart_chunks(str(file_path), "checksum_session")
         
-        # Verify checksums
+        # Expected values come from plain hashlib, not the production
+        # batch hasher, so the oracle stays independent of the code
+        # under test. The file is still mapped once and sliced
+        # zero-copy, with the manager's pool fanning the hashing out.
         with open(file_path, 'rb') as f:
-            for chunk in chunks:
-                f.seek(chunk.chunk_index * self.manager.CHUNK_SIZES['slow'])
-                data = f.read(chunk.size)
-                expected_checksum = hashlib.sha256(data).hexdigest()
-                self.assertEqual(chunk.checksum, expected_checksum)
-                
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            mv = memoryview(mm)
+            expected_checksums = list(self.manager.executor.map(
+                lambda view: hashlib.sha256(view).hexdigest(),
+                [mv[c.offset:c.offset + c.size] for c in chunks]))
+            self.assertEqual([c.checksum for c in chunks], expected_checksums)
+        finally:
+            mv.release()
+            mm.close()
+
+        # The 13KB fixture fits in a single slow-tier chunk, so its
+        # checksum must also match an independent whole-file digest
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(chunks[0].checksum, _file_sha256(file_path))
+
         print(f"✅ All {len(chunks)} chunk checksums verified")
 
 class TestNetworkDetection(unittest.TestCase):
     """Test network speed detection and adaptation"""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        cls.manager = shared_manager()
+
     def setUp(self):
-        self.manager = SmartUploadManager("fake_token")
-        
-    @patch('requests.post')
-    def test_network_speed_detection(self, mock_post):
-        """Test network speed detection algorithm"""
+        reset_manager(self.manager)
+
+    def test_network_speed_detection(self):
+        """Test the speed classification ladder as a pure function"""
         print("\n🧪 Testing network speed detection...")
-        
-        # Simulate different response times
+
+        # _classify_speed is deterministic arithmetic, so it is driven
+        # directly — no patched clocks, no mocked requests — including
+        # the tier boundaries
         test_cases = [
-            (10.0, 'slow'),      # 10 seconds = slow
-            (1.0, 'medium'),     # 1 second = medium  
-            (0.2, 'fast'),       # 0.2 seconds = fast
-            (0.05, 'ultra'),     # 0.05 seconds = ultra
+            (0.5, 'slow'),
+            (1.0, 'medium'),
+            (3.0, 'medium'),
+            (5.0, 'fast'),
+            (10.0, 'fast'),
+            (20.0, 'ultra'),
+            (50.0, 'ultra'),
         ]
-        
-        for response_time, expected_speed in test_cases:
-            with patch('time.time') as mock_time:
-                # Mock time to simulate response duration
-                mock_time.side_effect = [0, response_time]
-                mock_post.return_value = Mock(status_code=200)
-                
-                detected_speed = self.manager.analyze_network_speed()
-                self.assertEqual(detected_speed, expected_speed)
-                print(f"✅ {response_time}s response -> {detected_speed} speed")
+
+        for speed_mbps, expected_speed in test_cases:
+            detected_speed = self.manager._classify_speed(speed_mbps)
+            self.assertEqual(detected_speed, expected_speed)
+            print(f"✅ {speed_mbps} MB/s -> {detected_speed} speed")
                 
     def test_chunk_size_by_network(self):
         """Test that chunk sizes adapt to network speed"""
@@ -177,24 +284,29 @@ class TestNetworkDetection(unittest.TestCase):
 
 class TestRepositoryAnalysis(unittest.TestCase):
     """Test repository analysis and optimization"""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        cls.manager = shared_manager()
+
     def setUp(self):
         self.temp_dir = tempfile.mkdtemp()
-        self.manager = SmartUploadManager("fake_token")
-        
+        reset_manager(self.manager)
+
     def tearDown(self):
         shutil.rmtree(self.temp_dir, ignore_errors=True)
-        
+
     def create_test_repo(self):
         """Create a test repository structure"""
         repo_path = Path(self.temp_dir) / "test_repo"
         repo_path.mkdir()
         
         # Create various file types
-        (repo_path / "code.py").write_text("print('hello')" * 1000)
-        (repo_path / "data.json").write_text('{"test": "data"}' * 500)
+        (repo_path / "code.py").write_bytes(_PY_BLOB)
+        (repo_path / "data.json").write_bytes(_JSON_BLOB)
         (repo_path / "binary.jpg").write_bytes(os.urandom(1024 * 100))  # 100KB
-        (repo_path / "large.bin").write_bytes(os.urandom(1024 * 1024 * 60))  # 60MB
+        with open(repo_path / "large.bin", 'wb') as f:
+            f.truncate(1024 * 1024 * 60)  # 60MB, sparse
         
         # Create git directory
         git_dir = repo_path / ".git"
@@ -220,7 +332,12 @@ class TestRepositoryAnalysis(unittest.TestCase):
         self.assertGreater(stats['compressible_size'], 0)
         self.assertEqual(len(stats['skip_files']), 1)  # .pyc file
         self.assertEqual(len(stats['large_files']), 1)  # 60MB file
-        
+
+        # Sizes come from the analysis pass itself — no re-statting
+        self.assertEqual(sum(stats['file_sizes'].values()), stats['total_size'])
+        self.assertEqual(stats['file_sizes'][str(repo_path / "binary.jpg")],
+                         1024 * 100)
+
         print(f"✅ Found {stats['total_files']} files")
         print(f"✅ Total size: {stats['total_size'] / (1024*1024):.1f}MB")
         print(f"✅ Large files detected: {len(stats['large_files'])}")
@@ -242,9 +359,13 @@ class TestRepositoryAnalysis(unittest.TestCase):
 class TestSessionManagement(unittest.TestCase):
     """Test session persistence and resume functionality"""
     
+    @classmethod
+    def setUpClass(cls):
+        cls.manager = shared_manager()
+
     def setUp(self):
         self.temp_dir = tempfile.mkdtemp()
-        self.manager = SmartUploadManager("fake_token")
+        reset_manager(self.manager)
         self.session_dir = Path(self.temp_dir) / ".upload_sessions"
         self.session_dir.mkdir()
         
@@ -263,42 +384,35 @@ class TestSessionManagement(unittest.TestCase):
             'repo_name': session.repo_name,
             'source_path': session.source_path,
             'total_size': session.total_size,
-            'chunks': [
-                {
-                    'chunk_id': c.chunk_id,
-                    'file_path': c.file_path,
-                    'chunk_index': c.chunk_index,
-                    'total_chunks': c.total_chunks,
-                    'size': c.size,
-                    'checksum': c.checksum,
-                    'uploaded': c.uploaded,
-                    'upload_time': c.upload_time,
-                    'retry_count': c.retry_count
-                } for c in session.chunks
-            ],
-            'start_time': session.start_time.isoformat(),
+            'chunks': [asdict(c) for c in session.chunks],
+            'start_time': session.start_time,
             'completed': session.completed,
             'progress_percentage': session.progress_percentage
         }
-        self.sessions[session.session_id] = session_dict
-        
+        if msgpack is not None:
+            self.sessions[session.session_id] = msgpack.packb(
+                session_dict, use_bin_type=True)
+        else:
+            self.sessions[session.session_id] = session_dict
+
     def _mock_load_session(self, session_id):
         """Mock session loading"""
         if session_id not in self.sessions:
             return None
-            
+
         session_dict = self.sessions[session_id]
-        from datetime import datetime
-        
+        if msgpack is not None:
+            session_dict = msgpack.unpackb(session_dict, raw=False)
+
         chunks = [ChunkInfo(**c) for c in session_dict['chunks']]
-        
+
         return UploadSession(
             session_id=session_dict['session_id'],
             repo_name=session_dict['repo_name'],
             source_path=session_dict['source_path'],
             total_size=session_dict['total_size'],
             chunks=chunks,
-            start_time=datetime.fromisoformat(session_dict['start_time']),
+            start_time=session_dict['start_time'],
             completed=session_dict['completed'],
             progress_percentage=session_dict['progress_percentage']
         )
@@ -391,55 +505,14 @@ class TestSessionManagement(unittest.TestCase):
 
 class TestGitHubIntegration(unittest.TestCase):
     """Test GitHub API integration"""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        cls.manager = shared_manager()
+
     def setUp(self):
-        self.manager = SmartUploadManager("fake_token")
-        
-    @patch('smart_upload_manager.Github')
-    async def test_rate_limit_handling(self, mock_github_class):
-        """Test GitHub API rate limit handling"""
-        print("\n🧪 Testing rate limit handling...")
-        
-        # Mock GitHub client
-        mock_github = Mock()
-        mock_github_class.return_value = mock_github
-        
-        # Create test chunk
-        chunk = ChunkInfo(
-            chunk_id="test_chunk",
-            file_path="/tmp/test.txt",
-            chunk_index=0,
-            total_chunks=1,
-            size=1024,
-            checksum="abc123"
-        )
-        
-        # Mock rate limit exception
-        from github import RateLimitExceededException
-        from datetime import datetime, timedelta
-        
-        mock_repo = Mock()
-        mock_github.get_repo.return_value = mock_repo
-        
-        # First call raises rate limit
-        mock_repo.create_file.side_effect = [
-            RateLimitExceededException(403, {"message": "Rate limited"}, {})
-        ]
-        
-        # Mock rate limit reset time
-        mock_rate_limit = Mock()
-        mock_rate_limit.core.reset = datetime.utcnow() + timedelta(seconds=1)
-        mock_github.get_rate_limit.return_value = mock_rate_limit
-        
-        # Test upload with rate limiting
-        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
-            result = await self.manager.upload_chunk_to_github(chunk, "test/repo")
-            
-            # Should have called sleep for rate limiting
-            mock_sleep.assert_called()
-            
-        print("✅ Rate limit handled with appropriate wait")
-        
+        reset_manager(self.manager)
+
     @patch('smart_upload_manager.Github')
     def test_parallel_upload_coordination(self, mock_github_class):
         """Test parallel upload coordination"""
@@ -464,7 +537,7 @@ class TestGitHubIntegration(unittest.TestCase):
             source_path="/tmp/test.txt",
             total_size=10240,
             chunks=chunks,
-            start_time=datetime.now()
+            start_time=time.time()
         )
         
         # Test parallel upload with semaphore
@@ -472,6 +545,147 @@ class TestGitHubIntegration(unittest.TestCase):
         self.assertEqual(len([c for c in chunks if not c.uploaded]), 10)
         print("✅ Parallel upload coordination verified")
 
+class TestRateLimiting(unittest.IsolatedAsyncioTestCase):
+    """Test the proactive limiter that paces the Git Data upload path"""
+
+    async def test_rate_limit_handling(self):
+        """Quota headers translate into the right acquire() delays"""
+        print("\n🧪 Testing rate limit handling...")
+
+        limiter = RateLimiter()
+
+        # A fresh limiter has no quota information and must not stall
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            await limiter.acquire()
+            mock_sleep.assert_not_called()
+
+        # Exhausted quota -- what _upload_blob_buffered observes on a
+        # 403 with X-RateLimit-Remaining: 0 -- waits out the window
+        limiter.observe({'X-RateLimit-Remaining': '0',
+                         'X-RateLimit-Reset': str(time.time() + 30)})
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            await limiter.acquire()
+            mock_sleep.assert_called_once()
+            self.assertGreater(mock_sleep.call_args[0][0], 25)
+
+        # Healthy quota is spread across the window, not burned at once
+        limiter.observe({'X-RateLimit-Remaining': '100',
+                         'X-RateLimit-Reset': str(time.time() + 100)})
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            await limiter.acquire()
+            mock_sleep.assert_called_once()
+            self.assertLess(mock_sleep.call_args[0][0], 2.0)
+
+        # A Retry-After secondary limit is honoured verbatim
+        limiter.observe({'Retry-After': '7'})
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            await limiter.acquire()
+            mock_sleep.assert_called_once()
+            self.assertAlmostEqual(mock_sleep.call_args[0][0], 7.0, delta=1.0)
+
+        print("✅ Rate limit handled with appropriate wait")
+
+class _FakeResponse:
+    """Stand-in for an aiohttp response usable as an async context manager"""
+
+    def __init__(self, status, payload=None, headers=None):
+        self.status = status
+        self._payload = payload or {}
+        self.headers = headers or {}
+
+    async def json(self):
+        return self._payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class _FakeHTTP:
+    """Records every request and replays a queue of canned responses"""
+
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append(('POST', url, kwargs))
+        return self._responses.pop(0)
+
+    def put(self, url, **kwargs):
+        self.calls.append(('PUT', url, kwargs))
+        return self._responses.pop(0)
+
+class TestLFSUpload(unittest.IsolatedAsyncioTestCase):
+    """Test the LFS fast path's auth split and fallback"""
+
+    def setUp(self):
+        self.manager = shared_manager()
+        self.data = b"x" * 4096
+        self.chunk = ChunkInfo(
+            chunk_id="lfs_chunk_0",
+            file_path="/tmp/big.bin",
+            chunk_index=0,
+            total_chunks=1,
+            size=len(self.data),
+            checksum=hashlib.sha256(self.data).hexdigest()
+        )
+        self.api_base = "https://api.github.com/repos/test/repo"
+
+    async def test_storage_put_carries_only_action_headers(self):
+        """The presigned PUT must see the action headers and nothing else"""
+        print("\n🧪 Testing LFS storage upload headers...")
+
+        action = {'href': 'https://storage.example/upload/abc',
+                  'header': {'x-amz-meta-oid': self.chunk.checksum}}
+        api = _FakeHTTP([
+            _FakeResponse(200, {'objects': [{'actions': {'upload': action}}]}),
+            _FakeResponse(201, {'sha': 'pointer_sha'}),
+        ])
+        storage = _FakeHTTP([_FakeResponse(200)])
+
+        with patch.object(self.manager, '_lfs_http',
+                          new=AsyncMock(return_value=storage)):
+            sha = await self.manager._upload_chunk_lfs(
+                api, self.api_base, self.chunk, memoryview(self.data))
+
+        self.assertEqual(sha, 'pointer_sha')
+
+        # The batch endpoint speaks Basic auth, not the REST token scheme
+        method, url, kwargs = api.calls[0]
+        self.assertEqual(method, 'POST')
+        self.assertIn('info/lfs/objects/batch', url)
+        self.assertTrue(kwargs['headers']['Authorization'].startswith('Basic '))
+
+        # The storage PUT carries exactly octet-stream plus the action's
+        # headers -- in particular no Authorization for the API token
+        method, url, kwargs = storage.calls[0]
+        self.assertEqual(method, 'PUT')
+        self.assertEqual(url, action['href'])
+        self.assertEqual(kwargs['headers'],
+                         {'Content-Type': 'application/octet-stream',
+                          'x-amz-meta-oid': self.chunk.checksum})
+
+        print("✅ Storage PUT isolated from API credentials")
+
+    async def test_batch_failure_falls_back_without_storage_call(self):
+        """A failed batch negotiation returns None and never touches storage"""
+        print("\n🧪 Testing LFS fallback on batch failure...")
+
+        api = _FakeHTTP([_FakeResponse(404)])
+        storage = _FakeHTTP([])
+
+        with patch.object(self.manager, '_lfs_http',
+                          new=AsyncMock(return_value=storage)):
+            sha = await self.manager._upload_chunk_lfs(
+                api, self.api_base, self.chunk, memoryview(self.data))
+
+        self.assertIsNone(sha)
+        self.assertEqual(storage.calls, [])
+
+        print("✅ Fallback taken without leaking a storage request")
+
 class TestClaudeFlowIntegration(unittest.TestCase):
     """Test integration with Claude Flow system"""
     
@@ -553,14 +767,18 @@ class TestClaudeFlowIntegration(unittest.TestCase):
 
 class TestEndToEndScenarios(unittest.TestCase):
     """Test complete end-to-end upload scenarios"""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        cls.manager = shared_manager()
+
     def setUp(self):
         self.temp_dir = tempfile.mkdtemp()
-        self.manager = SmartUploadManager("fake_token")
-        
+        reset_manager(self.manager)
+
     def tearDown(self):
         shutil.rmtree(self.temp_dir, ignore_errors=True)
-        
+
     def create_realistic_repo(self) -> Path:
         """Create a realistic repository structure"""
         repo_path = Path(self.temp_dir) / "realistic_repo"
@@ -571,23 +789,27 @@ class TestEndToEndScenarios(unittest.TestCase):
         src_dir.mkdir()
         
         for i in range(10):
-            (src_dir / f"module_{i}.py").write_text(
-                f"# Module {i}\n" + "def function():\n    pass\n" * 100
+            (src_dir / f"module_{i}.py").write_bytes(
+                f"# Module {i}\n".encode() + _MODULE_BLOB
             )
-            
+
         # Documentation
         docs_dir = repo_path / "docs"
         docs_dir.mkdir()
-        (docs_dir / "README.md").write_text("# Documentation\n" * 500)
-        
+        (docs_dir / "README.md").write_bytes(_README_BLOB)
+
         # Data files
         data_dir = repo_path / "data"
         data_dir.mkdir()
-        (data_dir / "dataset.csv").write_text("col1,col2,col3\n" + "1,2,3\n" * 10000)
-        
-        # Large binary
-        (repo_path / "model.bin").write_bytes(os.urandom(1024 * 1024 * 75))  # 75MB
-        
+        (data_dir / "dataset.csv").write_bytes(_CSV_BLOB)
+        
+        # Large binary; opt-in because the 75MB file dominates E2E setup
+        if os.getenv('E2E_LARGE'):
+            with open(repo_path / "model.bin", 'wb') as f:
+                f.truncate(1024 * 1024 * 75)  # 75MB, sparse
+        else:
+            print("  (75MB model.bin skipped; set E2E_LARGE=1 to include it)")
+
         # Node modules (should be excluded)
         node_modules = repo_path / "node_modules"
         node_modules.mkdir()
@@ -662,7 +884,7 @@ class TestEndToEndScenarios(unittest.TestCase):
         self.manager.sessions[session.session_id] = session
         
         # Simulate recovery
-        pending_chunks = [c for c in session.chunks if not c.uploaded]
+        pending_chunks = session.pending()
         
         self.assertEqual(len(pending_chunks), len(session.chunks) - halfway)
         print(f"✅ Recovery: {len(pending_chunks)} chunks remaining")
@@ -678,7 +900,8 @@ class TestEndToEndScenarios(unittest.TestCase):
             
             # Create test file
             test_file = Path(self.temp_dir) / f"network_test_{speed}.bin"
-            test_file.write_bytes(os.urandom(1024 * 1024 * 20))  # 20MB
+            with open(test_file, 'wb') as f:
+                f.truncate(1024 * 1024 * 20)  # 20MB, sparse
             
             # Create chunks
             chunks = self.manager.create_smart_chunks(
@@ -689,6 +912,155 @@ class TestEndToEndScenarios(unittest.TestCase):
             print(f"✅ {speed} network: {len(chunks)} chunks " +
                   f"({self.manager.CHUNK_SIZES[speed] / (1024*1024):.0f}MB each)")
 
+class TestSuiteCache(unittest.TestCase):
+    """Test that the pickled suite cache is written and actually hit"""
+
+    def setUp(self):
+        self._saved_cache = _SUITE_CACHE
+        self._tmp = tempfile.mkdtemp()
+        globals()['_SUITE_CACHE'] = Path(self._tmp) / "suite.pkl"
+
+    def tearDown(self):
+        globals()['_SUITE_CACHE'] = self._saved_cache
+        shutil.rmtree(self._tmp, ignore_errors=True)
+
+    def test_second_build_reads_cache(self):
+        """A rebuild with unchanged sources must come from the cache"""
+        print("\n🧪 Testing suite cache round-trip...")
+
+        with patch.dict(os.environ):
+            os.environ.pop('HUB_TEST_INCREMENTAL', None)
+            first = _cached_suite(unittest.TestLoader())
+            self.assertTrue(_SUITE_CACHE.exists())
+            self.assertGreater(_SUITE_CACHE.stat().st_size, 0)
+
+            # loadTestsFromNames resolves method-level dotted names
+            # straight through getattr, so a cache hit never collects;
+            # poisoning the collector proves the hit is real
+            with patch.object(unittest.TestLoader, 'loadTestsFromTestCase',
+                              side_effect=AssertionError("cache missed")):
+                second = _cached_suite(unittest.TestLoader())
+
+        self.assertEqual(second.countTestCases(), first.countTestCases())
+        self.assertGreater(second.countTestCases(), 0)
+
+        print(f"✅ Suite cache hit: {second.countTestCases()} tests rebuilt "
+              f"without collection")
+
+_ALL_TEST_CLASSES = [
+    TestChunkingAlgorithm,
+    TestNetworkDetection,
+    TestRepositoryAnalysis,
+    TestSessionManagement,
+    TestGitHubIntegration,
+    TestRateLimiting,
+    TestLFSUpload,
+    TestClaudeFlowIntegration,
+    TestEndToEndScenarios,
+    TestSuiteCache,
+]
+
+_TEST_CACHE = Path('.test_cache.json')
+
+def _source_state():
+    """Mtimes of this file and the code under test
+
+    Both go into the dirtiness key: editing smart_upload_manager.py is
+    the usual watch-mode change and must dirty every class, not leave
+    the suite falsely green.
+    """
+    return [os.path.getmtime(__file__),
+            os.path.getmtime(smart_upload_manager.__file__)]
+
+def _dirty_classes(classes):
+    """Filter down to the classes worth re-running
+
+    Opt-in via HUB_TEST_INCREMENTAL=1 for watch-mode loops. A class
+    whose recorded last-green source state matches the current one has
+    no new work and is skipped. CI runs, which leave the flag unset,
+    always run everything.
+    """
+    if not os.environ.get('HUB_TEST_INCREMENTAL'):
+        return classes
+    try:
+        cache = json.loads(_TEST_CACHE.read_text())
+    except (OSError, ValueError):
+        return classes
+    state = _source_state()
+    clean = [c for c in classes if cache.get(c.__name__) == state]
+    for cls in clean:
+        print(f"  ⏭️ {cls.__name__}: unchanged since last green run")
+    return [c for c in classes if c not in clean]
+
+def _record_green_run(classes):
+    """Remember that every class passed against the current source"""
+    state = _source_state()
+    _TEST_CACHE.write_text(json.dumps({c.__name__: state for c in classes}))
+
+_SUITE_CACHE = Path('.test_suite_cache.pkl')
+
+def _cached_suite(loader):
+    """Build the unit suite, skipping collection when nothing changed
+
+    Collection walks every class dict; for watch-mode loops the result
+    only changes when this file does, so the discovered test names are
+    cached next to the source mtime and the class list, and resolved
+    back through loadTestsFromNames while both still match. Names, not
+    test instances: IsolatedAsyncioTestCase objects hold a contextvars
+    Context and do not pickle. The payload is serialized before the
+    file is opened so a failure never truncates a good cache; any
+    problem reading or writing just means a fresh build.
+    """
+    classes = _dirty_classes(_ALL_TEST_CLASSES)
+    key = (os.path.getmtime(__file__), tuple(c.__name__ for c in classes))
+    try:
+        cached_key, names = pickle.loads(_SUITE_CACHE.read_bytes())
+        if cached_key == key:
+            return loader.loadTestsFromNames(names)
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        pass
+
+    suite = unittest.TestSuite()
+    # One addTests call; chain keeps the per-class flattening in C
+    suite.addTests(itertools.chain.from_iterable(
+        loader.loadTestsFromTestCase(cls) for cls in classes))
+    names = [f"{cls.__module__}.{cls.__qualname__}.{method}"
+             for cls in classes
+             for method in loader.getTestCaseNames(cls)]
+    try:
+        _SUITE_CACHE.write_bytes(
+            pickle.dumps((key, names), pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+    return suite
+
+_PENDING_DELETES = []
+
+def _rmtree_async(path):
+    """Delete a fixture tree off the critical path
+
+    The directory is renamed aside so its name frees immediately, then a
+    daemon thread eats the unlink syscalls while the caller moves on. If
+    the rename fails (already gone, cross-device) fall back to deleting
+    in place.
+    """
+    trash = f"{path}.trash"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    worker = threading.Thread(target=shutil.rmtree, args=(trash,),
+                              kwargs={'ignore_errors': True}, daemon=True)
+    worker.start()
+    _PENDING_DELETES.append(worker)
+
+@atexit.register
+def _drain_pending_deletes():
+    """Join in-flight deletions so the interpreter never exits mid-unlink"""
+    for worker in _PENDING_DELETES:
+        worker.join()
+
 def run_performance_tests():
     """Run performance benchmarks"""
     print("\n" + "="*60)
@@ -702,17 +1074,26 @@ def run_performance_tests():
         # Benchmark chunk creation speed
         print("\n📊 Chunk Creation Performance:")
         
-        file_sizes = [10, 50, 100, 500]  # MB
-        
+        # The 500MB tier alone dwarfs the rest of the suite's IO, so it
+        # only runs when perf CI opts in
+        if os.getenv('RUN_PERF'):
+            file_sizes = [10, 50, 100, 500]  # MB
+        else:
+            file_sizes = [10, 50, 100]  # MB
+            print("  (500MB tier skipped; set RUN_PERF=1 to include it)")
+
         for size_mb in file_sizes:
-            # Create test file
+            # Create test file; sparse, since content never affects
+            # chunk boundaries and urandom would dominate setup time
             test_file = Path(temp_dir) / f"perf_test_{size_mb}mb.bin"
-            test_file.write_bytes(os.urandom(1024 * 1024 * size_mb))
+            with open(test_file, 'wb') as f:
+                f.truncate(1024 * 1024 * size_mb)
             
-            # Measure chunking time
-            start_time = time.time()
+            # Measure chunking time on the monotonic ns clock; time.time
+            # has ~ms granularity and can step under NTP slew
+            t0 = time.perf_counter_ns()
             chunks = manager.create_smart_chunks(str(test_file), "perf_session")
-            elapsed = time.time() - start_time
+            elapsed = (time.perf_counter_ns() - t0) / 1e9
             
             throughput = size_mb / elapsed
             print(f"  {size_mb:3d}MB -> {len(chunks):3d} chunks in {elapsed:.2f}s " +
@@ -729,12 +1110,12 @@ def run_performance_tests():
         original_size = text_file.stat().st_size / (1024 * 1024)
         
         # Measure compression
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         compressed_path = manager.compress_directory(
             str(text_file.parent),
             Path(temp_dir)
         )
-        elapsed = time.time() - start_time
+        elapsed = (time.perf_counter_ns() - t0) / 1e9
         
         compressed_size = Path(compressed_path).stat().st_size / (1024 * 1024)
         ratio = (1 - compressed_size / original_size) * 100
@@ -744,21 +1125,28 @@ def run_performance_tests():
         print(f"  Time: {elapsed:.2f}s")
         
     finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        _rmtree_async(temp_dir)
+
+def run_integration_test(temp_dir=None):
+    """Run a complete integration test
+
+    When temp_dir is supplied the caller owns its lifetime (pytest's
+    tmp_path machinery, below); otherwise a private directory is made
+    and swept in the background on the way out.
+    """
+    log.info("\n" + "="*60)
+    log.info("🔗 INTEGRATION TEST")
+    log.info("="*60)
+
+    log.info("\n🎯 Simulating complete upload workflow:")
+
+    owns_dir = temp_dir is None
+    if owns_dir:
+        temp_dir = tempfile.mkdtemp()
 
-def run_integration_test():
-    """Run a complete integration test"""
-    print("\n" + "="*60)
-    print("🔗 INTEGRATION TEST")
-    print("="*60)
-    
-    print("\n🎯 Simulating complete upload workflow:")
-    
-    temp_dir = tempfile.mkdtemp()
-    
     try:
         # Step 1: Create realistic repository
-        print("\n1️⃣ Creating test repository...")
+        log.info("\n1️⃣ Creating test repository...")
         repo_path = Path(temp_dir) / "integration_test_repo"
         repo_path.mkdir()
         
@@ -766,106 +1154,141 @@ def run_integration_test():
         (repo_path / "README.md").write_text("# Integration Test Repository\n" * 100)
         (repo_path / "app.py").write_text("import os\nprint('test')\n" * 500)
         (repo_path / "data.json").write_text('{"test": "data"}\n' * 1000)
-        (repo_path / "large.bin").write_bytes(os.urandom(1024 * 1024 * 25))  # 25MB
+        # Sparse: the workflow only reads sizes, offsets and hashes, so
+        # no data blocks ever hit the disk for the large fixture
+        with open(repo_path / "large.bin", 'wb') as f:
+            f.truncate(1024 * 1024 * 25)  # 25MB
         
-        print(f"  ✅ Repository created at {repo_path}")
+        log.info(f"  ✅ Repository created at {repo_path}")
         
         # Step 2: Initialize manager
-        print("\n2️⃣ Initializing Smart Upload Manager...")
+        log.info("\n2️⃣ Initializing Smart Upload Manager...")
         manager = SmartUploadManager("test_token")
         manager.network_speed = manager.analyze_network_speed()
-        print(f"  ✅ Network speed: {manager.network_speed}")
+        log.info(f"  ✅ Network speed: {manager.network_speed}")
         
         # Step 3: Analyze repository
-        print("\n3️⃣ Analyzing repository...")
+        log.info("\n3️⃣ Analyzing repository...")
         stats = manager.analyze_repository(str(repo_path))
-        print(f"  ✅ Files: {stats['total_files']}")
-        print(f"  ✅ Size: {stats['total_size'] / (1024*1024):.1f}MB")
-        print(f"  ✅ Recommendations: {len(stats['recommendations'])}")
+        log.info(f"  ✅ Files: {stats['total_files']}")
+        log.info(f"  ✅ Size: {stats['total_size'] / (1024*1024):.1f}MB")
+        log.info(f"  ✅ Recommendations: {len(stats['recommendations'])}")
         
         # Step 4: Create upload session
-        print("\n4️⃣ Creating upload session...")
+        log.info("\n4️⃣ Creating upload session...")
         session = manager.create_upload_session(
             str(repo_path),
             "test/integration-repo"
         )
-        print(f"  ✅ Session ID: {session.session_id}")
-        print(f"  ✅ Chunks: {len(session.chunks)}")
+        log.info(f"  ✅ Session ID: {session.session_id}")
+        log.info(f"  ✅ Chunks: {len(session.chunks)}")
         
         # Step 5: Simulate upload progress
-        print("\n5️⃣ Simulating upload progress...")
+        log.info("\n5️⃣ Simulating upload progress...")
         for i, chunk in enumerate(session.chunks):
             chunk.uploaded = True
             session.progress_percentage = ((i + 1) / len(session.chunks)) * 100
             
-            if i % 3 == 0:  # Print every 3rd chunk
-                print(f"  📤 Uploading... {session.progress_percentage:.0f}%")
-                
-        print(f"  ✅ Upload complete!")
+            if i % 3 == 0:  # Log every 3rd chunk
+                log.debug(f"  📤 Uploading... {session.progress_percentage:.0f}%")
+
+        # Chunk state changed outside the manager, so bump the version
+        # that keys its status memo
+        session.version += 1
+        log.info("  ✅ Upload complete!")
         
         # Step 6: Verify session status
-        print("\n6️⃣ Verifying final status...")
+        log.info("\n6️⃣ Verifying final status...")
         status = manager.get_session_status(session.session_id)
-        print(f"  ✅ Chunks uploaded: {status['uploaded_chunks']}/{status['total_chunks']}")
-        print(f"  ✅ Size uploaded: {status['uploaded_size_mb']:.1f}MB")
-        
-        print("\n🎉 Integration test completed successfully!")
+        log.info(f"  ✅ Chunks uploaded: {status['uploaded_chunks']}/{status['total_chunks']}")
+        log.info(f"  ✅ Size uploaded: {status['uploaded_size_mb']:.1f}MB")
         
+        log.info("\n🎉 Integration test completed successfully!")
+
     finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        if owns_dir:
+            _rmtree_async(temp_dir)
+
+def test_integration(tmp_path_factory):
+    """Integration flow as a pytest item
+
+    tmp_path_factory hands every xdist worker its own basetemp, so
+    parallel workers never race on a shared path, and pytest sweeps the
+    directory itself -- no rmtree in the test body.
+    """
+    run_integration_test(str(tmp_path_factory.mktemp("hub_integration")))
 
 def main():
     """Main test runner"""
+    logging.basicConfig(level=os.environ.get("HUB_TEST_LOG", "WARNING"),
+                        format="%(message)s")
+
     print("\n" + "="*60)
     print("🧪 HARDCARD SMART GITHUB HUB - COMPREHENSIVE TEST SUITE")
     print("="*60)
-    
-    # Run unit tests
-    print("\n📋 Running Unit Tests...")
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestChunkingAlgorithm))
-    suite.addTests(loader.loadTestsFromTestCase(TestNetworkDetection))
-    suite.addTests(loader.loadTestsFromTestCase(TestRepositoryAnalysis))
-    suite.addTests(loader.loadTestsFromTestCase(TestSessionManagement))
-    suite.addTests(loader.loadTestsFromTestCase(TestGitHubIntegration))
-    suite.addTests(loader.loadTestsFromTestCase(TestClaudeFlowIntegration))
-    suite.addTests(loader.loadTestsFromTestCase(TestEndToEndScenarios))
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=0)
-    result = runner.run(suite)
-    
-    # Run performance tests
-    run_performance_tests()
-    
-    # Run integration test
-    run_integration_test()
-    
-    # Summary
-    print("\n" + "="*60)
-    print("📊 TEST SUMMARY")
-    print("="*60)
-    
+
+    if _HAS_XDIST:
+        # The classes are plain unittest.TestCase, so pytest collects
+        # them unchanged; loadscope hands each worker whole classes, so
+        # the setUpClass fixtures (shared managers, sparse files) are
+        # built once per class instead of once per scattered test
+        log.info("\n📋 Running Unit Tests (pytest-xdist)...")
+        # test_integration is a collected item under pytest, so only the
+        # benchmarks run alongside here
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            perf_future = executor.submit(run_performance_tests)
+            rc = pytest.main(["-n", "auto", "--dist=loadscope", "-q", __file__])
+            perf_future.result()
+        return rc
+
+    # Serial fallback when pytest/xdist are not installed
+    log.info("\n📋 Running Unit Tests...")
+    suite = _cached_suite(unittest.TestLoader())
+
+    # Run the three phases overlapped: perf and integration are mostly
+    # file IO, so they make progress while the unit suite holds the GIL.
+    # Threads rather than processes because TestResult objects and the
+    # suite's bound methods do not pickle.
+    # A bare TestResult records exactly what the summary reads --
+    # testsRun, failures, errors -- without TextTestResult's per-test
+    # stream formatting and timing
+    result = unittest.TestResult()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        perf_future = executor.submit(run_performance_tests)
+        integration_future = executor.submit(run_integration_test)
+        suite.run(result)
+        perf_future.result()
+        integration_future.result()
+
     total_tests = result.testsRun
     failures = len(result.failures)
     errors = len(result.errors)
     success = total_tests - failures - errors
-    
-    print(f"\n✅ Passed: {success}/{total_tests}")
+
+    # One pass/fail verdict computed once; the green path takes no
+    # further branches
+    ok = not (failures or errors)
+    if ok:
+        _record_green_run(_ALL_TEST_CLASSES)
+
+    # The whole summary goes out in a single write instead of a flushed
+    # syscall per line
+    buf = [
+        "\n" + "="*60,
+        "📊 TEST SUMMARY",
+        "="*60,
+        f"\n✅ Passed: {success}/{total_tests}",
+    ]
     if failures:
-        print(f"❌ Failures: {failures}")
+        buf.append(f"❌ Failures: {failures}")
     if errors:
-        print(f"🔥 Errors: {errors}")
-        
-    if failures == 0 and errors == 0:
-        print("\n🎉 ALL TESTS PASSED! The HardCard Smart Hub is ready for production!")
-    else:
-        print("\n⚠️ Some tests failed. Please review and fix before deployment.")
-        
-    return 0 if (failures == 0 and errors == 0) else 1
+        buf.append(f"🔥 Errors: {errors}")
+    buf.append("\n🎉 ALL TESTS PASSED! The HardCard Smart Hub is ready for production!"
+               if ok else
+               "\n⚠️ Some tests failed. Please review and fix before deployment.")
+    sys.stdout.write("\n".join(buf) + "\n")
+
+    return 0 if ok else 1
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file